@@ -1,8 +1,7 @@
 import logging
 import sys
 import time as _time
-import traceback
-from typing import Callable, Final, Optional
+from typing import Callable, Final, Optional, Tuple
 
 import glfw
 
@@ -12,22 +11,6 @@ from PyxelEngine.io.monitor import Monitor
 from PyxelEngine.math import Vector2
 from PyxelEngine.math import Vector2Like
 
-formatter = logging.Formatter(
-    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %I:%M:%S",  # yyyy-MM-dd HH:mm:ss
-    style="%",
-    validate=True,
-)
-
-console_handler = logging.StreamHandler(stream=sys.stdout)
-console_handler.setFormatter(formatter)
-console_handler.setLevel(logging.INFO)
-
-root_logger = logging.getLogger(PyxelEngine.__title__)
-root_logger.propagate = True
-root_logger.setLevel(logging.DEBUG)
-root_logger.handlers = [console_handler]
-
 logger = logging.getLogger(__name__)
 logger.parent = logging.getLogger(PyxelEngine.__title__)
 
@@ -45,6 +28,26 @@ class Internal:
     main_running: bool = False
     render_running: bool = False
 
+    glfw_version: Optional[Tuple[Tuple[int, int, int], str]] = None
+
+
+def _configure_logging(level: int) -> None:
+    formatter = logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %I:%M:%S",  # yyyy-MM-dd HH:mm:ss
+        style="%",
+        validate=True,
+    )
+
+    console_handler = logging.StreamHandler(stream=sys.stdout)
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(level)
+
+    root_logger = logging.getLogger(PyxelEngine.__title__)
+    root_logger.propagate = True
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.handlers = [console_handler]
+
 
 def setup(func: Callable[[], None]) -> Callable[[], None]:
     Internal.setup_func = func
@@ -68,7 +71,7 @@ def start(
         sys.exit("PyxelEngine.core.start can only be called once")
     Internal.started = True
 
-    console_handler.setLevel(log_level)
+    _configure_logging(log_level)
 
     Internal.size[:] = size
     Internal.pixel_size[:] = pixel_size
@@ -118,10 +121,20 @@ def start(
         _destroy_internal()
 
 
+def _get_glfw_version() -> Tuple[Tuple[int, int, int], str]:
+    if Internal.glfw_version is None:
+        Internal.glfw_version = (
+            glfw.get_version(),
+            glfw.get_version_string().decode(),
+        )
+    return Internal.glfw_version
+
+
 def _setup_internal() -> None:
     time.setup()
 
-    logger.debug("GLFW Setup: %s.%s.%s", *glfw.get_version())
+    version, version_string = _get_glfw_version()
+    logger.debug("GLFW Setup: %s.%s.%s (%s)", *version, version_string)
 
     if not glfw.init():
         raise RuntimeError("Could not setup GLFW")
@@ -170,31 +183,36 @@ def _destroy_io() -> None:
 # ---------- [SECTION] Callbacks ---------- #
 
 
-def _error_callback(error: int, description: bytes):
-    error_codes = {
-        0x00000000: "NO_ERROR",
-        0x00010001: "NOT_INITIALIZED",
-        0x00010002: "NO_CURRENT_CONTEXT",
-        0x00010003: "INVALID_ENUM",
-        0x00010004: "INVALID_VALUE",
-        0x00010005: "OUT_OF_MEMORY",
-        0x00010006: "API_UNAVAILABLE",
-        0x00010007: "VERSION_UNAVAILABLE",
-        0x00010008: "PLATFORM_ERROR",
-        0x00010009: "FORMAT_UNAVAILABLE",
-        0x0001000A: "NO_WINDOW_CONTEXT",
-    }
-
-    stack = traceback.extract_stack()
-    stack_str = "\n".join(
-        f'\t\tFile "{s.filename}", line {s.lineno} in {s.name}\n\t\t\t{s.line}'
-        for s in stack[:-2]
-    )
+# GLFW error codes are 0 or 0x00010000 plus a small contiguous index, so the
+# low 16 bits of a code in that range index straight into this tuple
+_error_codes: Final[Tuple[str, ...]] = (
+    "NO_ERROR",
+    "NOT_INITIALIZED",
+    "NO_CURRENT_CONTEXT",
+    "INVALID_ENUM",
+    "INVALID_VALUE",
+    "OUT_OF_MEMORY",
+    "API_UNAVAILABLE",
+    "VERSION_UNAVAILABLE",
+    "PLATFORM_ERROR",
+    "FORMAT_UNAVAILABLE",
+    "NO_WINDOW_CONTEXT",
+)
 
+
+def _error_callback(error: int, description: bytes):
+    index: int = error & 0xFFFF
+    if error == 0 or (error >> 16 == 1 and 0 < index < len(_error_codes)):
+        name: str = _error_codes[index]
+    else:
+        name: str = hex(error)
+    # stack_info leaves the stack walk to logging, which skips it entirely
+    # when the logger is not enabled for CRITICAL
     logger.critical(
-        f"[GLFW] {error_codes[error]} error\n"
-        f"\tDescription: {description.decode()}\n"
-        f"\tStacktrace:\n{stack_str}"
+        "[GLFW] %s error\n\tDescription: %s",
+        name,
+        description.decode(),
+        stack_info=True,
     )
 
 
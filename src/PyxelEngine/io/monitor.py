@@ -190,10 +190,8 @@ class Monitor:
         if isinstance(gamma_ramp, float):
             wait_task(lambda: glfw.set_gamma(self.handle, gamma_ramp))
         elif isinstance(gamma_ramp, GammaRamp):
-            r = gamma_ramp.red
-            g = gamma_ramp.green
-            b = gamma_ramp.blue
-            wait_task(lambda: glfw.set_gamma_ramp(self.handle, (r, g, b)))
+            ramp = gamma_ramp._to_glfw()
+            wait_task(lambda: glfw.set_gamma_ramp(self.handle, ramp))
 
 
 @dataclass(frozen=True)
@@ -254,3 +252,14 @@ class GammaRamp:
 
     def __repr__(self) -> str:
         return f"GammaRamp(size={self.size})"
+
+    def _to_glfw(self) -> Tuple[List[float], List[float], List[float]]:
+        # Goes through the public glfw.set_gamma_ramp, which normalizes and
+        # copies the channels one element at a time. That loop is cheaper over
+        # Python floats than over numpy scalars, hence one tolist() per channel
+        size = self.size
+        return (
+            self.red[:size].tolist(),
+            self.green[:size].tolist(),
+            self.blue[:size].tolist(),
+        )
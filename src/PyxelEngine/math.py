@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Iterable, Tuple, Type, Union
+from math import acos
+from math import sqrt
+from typing import Dict, Final, Iterable, Optional, Tuple, Type, Union
 
 import numpy as np
 
@@ -12,10 +14,14 @@ __all__ = [
     "Vector4Tuple",
     "Vector2c",
     "Vector2",
+    "ValueVector2",
     "Vector3c",
     "Vector3",
     "Vector4c",
     "Vector4",
+    "Vector2Array",
+    "Vector3Array",
+    "Vector4Array",
     "Vector2Like",
     "Vector3Like",
     "Vector4Like",
@@ -38,8 +44,19 @@ DType = Union[
 ]
 
 
+# Exact type checks for the common argument types before falling back to the
+# comparatively slow typing.Iterable check
+def _is_iterable(value) -> bool:
+    value_type = type(value)
+    if value_type is tuple or value_type is list or isinstance(value, np.ndarray):
+        return True
+    if value_type is float or value_type is int:
+        return False
+    return isinstance(value, Iterable)
+
+
 def _check_single(value: DType) -> DType:
-    if isinstance(value, Iterable):
+    if _is_iterable(value):
         raise TypeError("Invalid Arguments Provided")
     return value
 
@@ -48,78 +65,305 @@ class Vector2Tuple(Tuple[DType, DType]):
     def __new__(cls, *data) -> Vector2Tuple:
         dlen = len(data)
         if dlen == 0:
+            if cls is Vector2Tuple:
+                return _zero2
             return super().__new__(cls, (0, 0))
         if dlen == 1:
-            if isinstance(data[0], Iterable):
-                return Vector2Tuple.__new__(cls, *data[0])
-            return super().__new__(cls, (data[0], data[0]))
+            value = data[0]
+            if type(value) is int and cls is Vector2Tuple:
+                interned = _small2.get(value)
+                if interned is not None:
+                    return interned
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                value = value.tolist()
+            if type(value) is tuple or type(value) is list:
+                # Sized input that is too long for any signature is rejected
+                # before it is unpacked into the parser
+                if len(value) > 2:
+                    raise TypeError("Invalid Arguments Provided")
+                return Vector2Tuple.__new__(cls, *value)
+            if _is_iterable(value):
+                return Vector2Tuple.__new__(cls, *value)
+            return super().__new__(cls, (value, value))
         if dlen == 2:
-            return super().__new__(cls, tuple(_check_single(v) for v in data))
+            return super().__new__(
+                cls, (_check_single(data[0]), _check_single(data[1]))
+            )
         raise TypeError("Invalid Arguments Provided")
 
 
+# Shared result of Vector2Tuple(), tuples are immutable so every caller can
+# be handed the same instance
+_zero2: Final[Vector2Tuple] = tuple.__new__(Vector2Tuple, (0, 0))
+
+# Same for the small splatted ints, Vector2Tuple(1) etc, which are used as
+# sizes and offsets all over the engine. Keyed on exact ints only so 1.0 and
+# True still produce their own types.
+_small2: Final[Dict[int, Vector2Tuple]] = {
+    i: tuple.__new__(Vector2Tuple, (i, i)) for i in range(64)
+}
+
+
 class Vector3Tuple(Tuple[DType, DType, DType]):
     def __new__(cls, *data) -> Vector3Tuple:
         dlen = len(data)
         if dlen == 0:
+            if cls is Vector3Tuple:
+                return _zero3
             return super().__new__(cls, (0, 0, 0))
         if dlen == 1:
-            if isinstance(data[0], Iterable):
-                return Vector3Tuple.__new__(cls, *data[0])
-            return super().__new__(cls, (data[0], data[0], data[0]))
+            value = data[0]
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                value = value.tolist()
+            if type(value) is tuple or type(value) is list:
+                if len(value) > 3:
+                    raise TypeError("Invalid Arguments Provided")
+                return Vector3Tuple.__new__(cls, *value)
+            if _is_iterable(value):
+                return Vector3Tuple.__new__(cls, *value)
+            return super().__new__(cls, (value, value, value))
         if dlen == 2:
-            if isinstance(data[0], Iterable):
+            if _is_iterable(data[0]):
                 return super().__new__(
-                    cls, (*Vector2Tuple(*data[0]), _check_single(data[1]))
+                    cls, (*Vector2Tuple(data[0]), _check_single(data[1]))
                 )
             raise TypeError("Invalid Arguments Provided")
         if dlen == 3:
-            return super().__new__(cls, tuple(_check_single(v) for v in data))
+            return super().__new__(
+                cls,
+                (
+                    _check_single(data[0]),
+                    _check_single(data[1]),
+                    _check_single(data[2]),
+                ),
+            )
         raise TypeError("Invalid Arguments Provided")
 
 
+_zero3: Final[Vector3Tuple] = tuple.__new__(Vector3Tuple, (0, 0, 0))
+
+
 class Vector4Tuple(Tuple[DType, DType, DType]):
     def __new__(cls, *data) -> Vector4Tuple:
         dlen = len(data)
         if dlen == 0:
+            if cls is Vector4Tuple:
+                return _zero4
             return super().__new__(cls, (0, 0, 0, 1))
         if dlen == 1:
-            if isinstance(data[0], Iterable):
-                return Vector4Tuple.__new__(cls, *data[0])
-            return super().__new__(cls, (data[0], data[0], data[0], 1))
+            value = data[0]
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                value = value.tolist()
+            if type(value) is tuple or type(value) is list:
+                if len(value) > 4:
+                    raise TypeError("Invalid Arguments Provided")
+                return Vector4Tuple.__new__(cls, *value)
+            if _is_iterable(value):
+                return Vector4Tuple.__new__(cls, *value)
+            return super().__new__(cls, (value, value, value, 1))
         if dlen == 2:
-            if isinstance(data[0], Iterable):
-                if isinstance(data[1], Iterable):
+            if _is_iterable(data[0]):
+                if _is_iterable(data[1]):
                     return super().__new__(
-                        cls, (*Vector2Tuple(*data[0]), *Vector2Tuple(*data[1]))
+                        cls, (*Vector2Tuple(data[0]), *Vector2Tuple(data[1]))
                     )
-                return super().__new__(cls, (*Vector3Tuple(*data[0]), data[1]))
+                return super().__new__(cls, (*Vector3Tuple(data[0]), data[1]))
             raise TypeError("Invalid Arguments Provided")
         if dlen == 3:
-            return super().__new__(cls, (*tuple(_check_single(v) for v in data), 1))
+            return super().__new__(
+                cls,
+                (
+                    _check_single(data[0]),
+                    _check_single(data[1]),
+                    _check_single(data[2]),
+                    1,
+                ),
+            )
         if dlen == 4:
-            return super().__new__(cls, tuple(_check_single(v) for v in data))
+            return super().__new__(
+                cls,
+                (
+                    _check_single(data[0]),
+                    _check_single(data[1]),
+                    _check_single(data[2]),
+                    _check_single(data[3]),
+                ),
+            )
         raise TypeError("Invalid Arguments Provided")
 
 
+_zero4: Final[Vector4Tuple] = tuple.__new__(Vector4Tuple, (0, 0, 0, 1))
+
+
+# numpy hands out one shared instance per native builtin dtype, so the fast
+# paths can test dtypes by identity instead of through dtype.__eq__. A dtype
+# that is equal but not identical (e.g. byte swapped) just takes numpy's path.
+_float64: Final[np.dtype] = np.dtype(np.float64)
+_int64: Final[np.dtype] = np.dtype(np.int64)
+
+
+# Right hand side of a Vector2 fast path as a pair of Python numbers, or None
+# when numpy has to handle it. Only combinations where plain Python arithmetic
+# gives the same result dtype as numpy qualify: float64 vectors with any real
+# valued operand, and int64 vectors with Python ints or other int64 vectors.
+def _fast_pair(vector: Vector2, other) -> Optional[Tuple[DType, DType]]:
+    dtype = vector.dtype
+    other_type = type(other)
+    if dtype is _float64:
+        if other_type is float or other_type is int:
+            return other, other
+        if other_type is tuple and len(other) == 2:
+            x_type = type(other[0])
+            y_type = type(other[1])
+            if (x_type is float or x_type is int) and (
+                y_type is float or y_type is int
+            ):
+                return other
+        if other_type is Vector2 and other.dtype.kind in "biuf":
+            return other.tolist()
+    elif dtype is _int64:
+        if other_type is int:
+            return other, other
+        if other_type is tuple and len(other) == 2:
+            if type(other[0]) is int and type(other[1]) is int:
+                return other
+        elif other_type is Vector2 and other.dtype is dtype:
+            return other.tolist()
+    return None
+
+
 class Vector2c(ABC):
-    pass
+    __slots__ = ()
 
 
 # noinspection PyUnresolvedReferences
 class Vector2(Vector2c, np.ndarray):
+    # No per-instance __dict__, these are created on every arithmetic result
+    __slots__ = ()
+
     def __new__(cls, *data, dtype: Type[DType] = float):
+        # Fast paths for the common component-wise and copy constructions,
+        # everything else goes through the full Vector2Tuple parser
+        dlen = len(data)
+        if dlen == 0:
+            return np.zeros(2, dtype=dtype).view(cls)
+        if dlen == 2:
+            x, y = data
+            x_type = type(x)
+            y_type = type(y)
+            # Two Python scalars is by far the most common call, so it is
+            # checked and filled inline rather than through _check_single
+            if (x_type is float or x_type is int) and (
+                y_type is float or y_type is int
+            ):
+                vector = np.empty(2, dtype=dtype).view(cls)
+                vector[0] = x
+                vector[1] = y
+                return vector
+            return cls._make(_check_single(x), _check_single(y), dtype)
+        if dlen == 1 and isinstance(data[0], np.ndarray) and data[0].shape == (2,):
+            return np.array(data[0], dtype=dtype).view(cls)
         return np.array(Vector2Tuple(*data), dtype=dtype).view(cls)
 
+    @classmethod
+    def _make(cls, x: DType, y: DType, dtype: Type[DType] = float) -> Vector2:
+        vector = np.empty(2, dtype=dtype).view(cls)
+        vector[0] = x
+        vector[1] = y
+        return vector
+
     def __eq__(self, other: Vector2Like) -> bool:
-        return np.all(super().__eq__(other))
+        if self is other:
+            return True
+        # Scalars, pairs and other Vector2s compare on Python values without
+        # allocating a boolean array
+        if type(other) is int or type(other) is float:
+            x, y = self.tolist()
+            return x == other and y == other
+        if isinstance(other, tuple) and len(other) == 2:
+            x, y = self.tolist()
+            return x == other[0] and y == other[1]
+        if isinstance(other, Vector2):
+            return self.tolist() == other.tolist()
+        return bool(np.all(super().__eq__(other)))
 
     def __ne__(self, other: Vector2Like) -> bool:
         return not self.__eq__(other)
 
+    # Operands accepted by _fast_pair are done on Python numbers, which is
+    # several times cheaper than a ufunc call on 2 elements. Every other
+    # combination keeps numpy's rules. Python ints never overflow, so an int64
+    # result that does not fit raises OverflowError on store; those fall back
+    # to numpy, which wraps around.
+    def __add__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                return Vector2._make(x + pair[0], y + pair[1], self.dtype)
+            except OverflowError:
+                pass
+        return super().__add__(other)
+
+    def __iadd__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                self[0] = x + pair[0]
+                self[1] = y + pair[1]
+                return self
+            except OverflowError:
+                self[0] = x
+        return super().__iadd__(other)
+
+    def __sub__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                return Vector2._make(x - pair[0], y - pair[1], self.dtype)
+            except OverflowError:
+                pass
+        return super().__sub__(other)
+
+    def __isub__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                self[0] = x - pair[0]
+                self[1] = y - pair[1]
+                return self
+            except OverflowError:
+                self[0] = x
+        return super().__isub__(other)
+
+    def __mul__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                return Vector2._make(x * pair[0], y * pair[1], self.dtype)
+            except OverflowError:
+                pass
+        return super().__mul__(other)
+
+    def __imul__(self, other: Vector2Like) -> Vector2:
+        pair = _fast_pair(self, other)
+        if pair is not None:
+            x, y = self.tolist()
+            try:
+                self[0] = x * pair[0]
+                self[1] = y * pair[1]
+                return self
+            except OverflowError:
+                self[0] = x
+        return super().__imul__(other)
+
     @property
     def x(self) -> DType:
-        return self[0]
+        return self.item(0)
 
     @x.setter
     def x(self, value: DType):
@@ -127,7 +371,7 @@ class Vector2(Vector2c, np.ndarray):
 
     @property
     def y(self) -> DType:
-        return self[1]
+        return self.item(1)
 
     @y.setter
     def y(self, value: DType):
@@ -135,33 +379,70 @@ class Vector2(Vector2c, np.ndarray):
 
     @property
     def magnitude(self) -> DType:
-        return np.linalg.norm(self)
+        x, y = self.tolist()
+        return sqrt(x * x + y * y)
 
     @magnitude.setter
     def magnitude(self, value: DType):
-        self.__imul__(value / self.magnitude)
+        x, y = self.tolist()
+        length = sqrt(x * x + y * y)
+        # Zero vectors (nan) and non-float dtypes (casting error) keep numpy's
+        # in-place semantics, the same split as normalize_self
+        if not length or self.dtype.kind != "f":
+            self.__imul__(np.divide(value, length))
+            return
+        scale = value / length
+        self[0] = x * scale
+        self[1] = y * scale
 
-    # noinspection PyTypeChecker
     @property
     def magnitude_sq(self) -> DType:
-        return np.dot(self, self)
+        x, y = self.tolist()
+        return x * x + y * y
 
     def normalize(self) -> Vector2:
         return self / self.magnitude
 
     def normalize_self(self) -> Vector2:
-        return self.__itruediv__(self.magnitude)
+        x, y = self.tolist()
+        length = sqrt(x * x + y * y)
+        # Zero vectors (nan) and non-float dtypes (casting error) keep numpy's
+        # in-place division semantics, matching normalize()
+        if length and self.dtype.kind == "f":
+            inv = 1.0 / length
+            self[0] = x * inv
+            self[1] = y * inv
+            return self
+        return self.__itruediv__(length)
 
     def perpendicular(self) -> Vector2:
-        return Vector2(self.y, -self.x)
+        if self.dtype.kind == "f":
+            x, y = self.tolist()
+            return Vector2._make(y, -x, self.dtype)
+        # Python ints cannot be negated into unsigned dtypes, numpy wraps them
+        result = self[[1, 0]]
+        np.negative(result[1:], out=result[1:])
+        return result
 
     def perpendicular_self(self) -> Vector2:
-        self[:] = self.y, -self.x
+        if self.dtype.kind == "f":
+            x, y = self.tolist()
+            self[0] = y
+            self[1] = -x
+            return self
+        self[:] = self[[1, 0]]
+        np.negative(self[1:], out=self[1:])
         return self
 
-    # noinspection PyTypeChecker
     def dot(self, other: Vector2Like) -> DType:
-        return np.dot(self, other)
+        # Pairs and vectors are summed on Python scalars, anything else (e.g. a
+        # scalar, which np.dot scales by) keeps np.dot's semantics
+        if type(other) is Vector2:
+            other = other.tolist()
+        elif type(other) is not tuple or len(other) != 2:
+            return np.dot(self, other)
+        x, y = self.tolist()
+        return x * other[0] + y * other[1]
 
     # noinspection PyTypeChecker
     def angle(self) -> float:
@@ -173,11 +454,14 @@ class Vector2(Vector2c, np.ndarray):
         return np.arctan2(det, dot)
 
     def distance(self, other: Vector2Like) -> float:
-        return np.linalg.norm(self - other)
+        return sqrt(self.distance_sq(other))
 
     def distance_sq(self, other: Vector2Like) -> float:
-        dx: float = self.x - other[0]
-        dy: float = self.y - other[1]
+        x, y = self.tolist()
+        # Parsed like every other operand so scalars and sequences both work
+        ox, oy = Vector2Tuple(other)
+        dx: float = x - ox
+        dy: float = y - oy
         return dx * dx + dy * dy
 
     def lerp(self, other: Vector2Like, t: float) -> Vector2:
@@ -186,32 +470,243 @@ class Vector2(Vector2c, np.ndarray):
     def smooth_step(self, other: Vector2Like, t: float) -> Vector2:
         t2 = t * t
         t3 = t2 * t
-        return (
-            (self + self - other - other) * t3
-            + (3.0 * other - 3.0 * self) * t2
-            + self * t
-            + self
+        # Same polynomial as before, regrouped by endpoint so only two
+        # scaled arrays and one sum are built instead of a temporary per term
+        b = 3.0 * t2 - 2.0 * t3
+        return self * (t + 1.0 - b) + np.multiply(other, b)
+
+
+# Plain Python pair for code that only needs component access and a few 2D
+# helpers. It is a fraction of the size and construction cost of a 2 element
+# ndarray, but every operation outside this class goes through __array__.
+class ValueVector2(Vector2c):
+    __slots__ = ("x", "y", "_dtype")
+
+    def __init__(self, *data, dtype: Type[DType] = float):
+        # Two Python numbers skip the parser, everything else (strings
+        # included) is validated by Vector2Tuple exactly as Vector2 does
+        x, y = data if len(data) == 2 else (None, None)
+        x_type = type(x)
+        y_type = type(y)
+        if not (
+            (x_type is float or x_type is int) and (y_type is float or y_type is int)
+        ):
+            x, y = Vector2Tuple(*data)
+        self.x: DType = dtype(x)
+        self.y: DType = dtype(y)
+        self._dtype: Type[DType] = dtype
+
+    @classmethod
+    def _make(cls, x: DType, y: DType, dtype: Type[DType]) -> ValueVector2:
+        vector = object.__new__(cls)
+        vector.x = x
+        vector.y = y
+        vector._dtype = dtype
+        return vector
+
+    # Out of place results keep the vector's dtype unless the math produced
+    # floats, matching numpy's promotion for Python scalars
+    def _result(self, x: DType, y: DType) -> ValueVector2:
+        if self._dtype is int and (type(x) is float or type(y) is float):
+            return ValueVector2._make(x, y, float)
+        return ValueVector2._make(x, y, self._dtype)
+
+    @staticmethod
+    def _pair(other: Vector2Like) -> Tuple[DType, DType]:
+        if type(other) is ValueVector2:
+            return other.x, other.y
+        return Vector2Tuple(other)
+
+    # In-place results are stored back in the vector's dtype, so like numpy's
+    # same_kind casting an integer vector refuses operands it would truncate
+    def _inplace_pair(self, other: Vector2Like) -> Tuple[DType, DType]:
+        x, y = self._pair(other)
+        if self.dtype.kind in "biu" and not (
+            isinstance(x, (int, np.integer)) and isinstance(y, (int, np.integer))
+        ):
+            raise TypeError(
+                f"Cannot cast {type(x).__name__} operands to dtype {self.dtype}"
+            )
+        return x, y
+
+    def __repr__(self) -> str:
+        return f"ValueVector2({self.x!r}, {self.y!r})"
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __getitem__(self, index: int) -> DType:
+        return (self.x, self.y)[index]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array((self.x, self.y), dtype=dtype or self._dtype)
+
+    def __eq__(self, other: Vector2Like) -> bool:
+        if self is other:
+            return True
+        try:
+            x, y = self._pair(other)
+        except TypeError:
+            return False
+        return self.x == x and self.y == y
+
+    def __ne__(self, other: Vector2Like) -> bool:
+        return not self.__eq__(other)
+
+    def __neg__(self) -> ValueVector2:
+        return ValueVector2._make(-self.x, -self.y, self._dtype)
+
+    def __add__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._pair(other)
+        return self._result(self.x + x, self.y + y)
+
+    __radd__ = __add__
+
+    def __iadd__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._inplace_pair(other)
+        self.x = self._dtype(self.x + x)
+        self.y = self._dtype(self.y + y)
+        return self
+
+    def __sub__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._pair(other)
+        return self._result(self.x - x, self.y - y)
+
+    def __rsub__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._pair(other)
+        return self._result(x - self.x, y - self.y)
+
+    def __isub__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._inplace_pair(other)
+        self.x = self._dtype(self.x - x)
+        self.y = self._dtype(self.y - y)
+        return self
+
+    def __mul__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._pair(other)
+        return self._result(self.x * x, self.y * y)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._inplace_pair(other)
+        self.x = self._dtype(self.x * x)
+        self.y = self._dtype(self.y * y)
+        return self
+
+    def __truediv__(self, other: Vector2Like) -> ValueVector2:
+        x, y = self._pair(other)
+        return self._result(self.x / x, self.y / y)
+
+    def astype(self, dtype: Type[DType], copy: bool = True) -> ValueVector2:
+        # Same contract as ndarray.astype: copy=False only skips the copy when
+        # the dtype already matches
+        if not copy and dtype is self._dtype:
+            return self
+        return ValueVector2(self.x, self.y, dtype=dtype)
+
+    def tolist(self) -> list:
+        return [self.x, self.y]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self._dtype)
+
+    @property
+    def magnitude(self) -> DType:
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    @property
+    def magnitude_sq(self) -> DType:
+        return self.x * self.x + self.y * self.y
+
+    def normalize(self) -> ValueVector2:
+        inv = 1.0 / self.magnitude
+        return ValueVector2._make(self.x * inv, self.y * inv, float)
+
+    def perpendicular(self) -> ValueVector2:
+        return ValueVector2._make(self.y, -self.x, self._dtype)
+
+    def perpendicular_self(self) -> ValueVector2:
+        self.x, self.y = self.y, -self.x
+        return self
+
+    def dot(self, other: Vector2Like) -> DType:
+        x, y = self._pair(other)
+        return self.x * x + self.y * y
+
+    def distance(self, other: Vector2Like) -> float:
+        return sqrt(self.distance_sq(other))
+
+    def distance_sq(self, other: Vector2Like) -> float:
+        x, y = self._pair(other)
+        dx = self.x - x
+        dy = self.y - y
+        return dx * dx + dy * dy
+
+    def lerp(self, other: Vector2Like, t: float) -> ValueVector2:
+        x, y = self._pair(other)
+        return ValueVector2._make(
+            self.x + (x - self.x) * t, self.y + (y - self.y) * t, float
         )
 
 
 class Vector3c(ABC):
-    pass
+    __slots__ = ()
 
 
 # noinspection PyUnresolvedReferences
 class Vector3(Vector3c, np.ndarray):
+    __slots__ = ()
+
     def __new__(cls, *data, dtype: Type[DType] = float):
+        # Fast paths for the common component-wise and copy constructions,
+        # everything else goes through the full Vector3Tuple parser
+        dlen = len(data)
+        if dlen == 0:
+            return np.zeros(3, dtype=dtype).view(cls)
+        if dlen == 3:
+            return cls._make(
+                _check_single(data[0]),
+                _check_single(data[1]),
+                _check_single(data[2]),
+                dtype,
+            )
+        if dlen == 1 and isinstance(data[0], np.ndarray) and data[0].shape == (3,):
+            return np.array(data[0], dtype=dtype).view(cls)
         return np.array(Vector3Tuple(*data), dtype=dtype).view(cls)
 
+    @classmethod
+    def _make(cls, x: DType, y: DType, z: DType, dtype: Type[DType] = float) -> Vector3:
+        vector = np.empty(3, dtype=dtype).view(cls)
+        vector[0] = x
+        vector[1] = y
+        vector[2] = z
+        return vector
+
     def __eq__(self, other: Vector3Like) -> bool:
-        return np.all(super().__eq__(other))
+        if self is other:
+            return True
+        if type(other) is int or type(other) is float:
+            x, y, z = self.tolist()
+            return x == other and y == other and z == other
+        if isinstance(other, tuple) and len(other) == 3:
+            x, y, z = self.tolist()
+            return x == other[0] and y == other[1] and z == other[2]
+        if isinstance(other, Vector3):
+            return self.tolist() == other.tolist()
+        return bool(np.all(super().__eq__(other)))
 
     def __ne__(self, other: Vector3Like) -> bool:
         return not self.__eq__(other)
 
     @property
     def x(self) -> DType:
-        return self[0]
+        return self.item(0)
 
     @x.setter
     def x(self, value: DType):
@@ -219,7 +714,7 @@ class Vector3(Vector3c, np.ndarray):
 
     @property
     def y(self) -> DType:
-        return self[1]
+        return self.item(1)
 
     @y.setter
     def y(self, value: DType):
@@ -227,7 +722,7 @@ class Vector3(Vector3c, np.ndarray):
 
     @property
     def z(self) -> DType:
-        return self[2]
+        return self.item(2)
 
     @z.setter
     def z(self, value: DType):
@@ -235,84 +730,145 @@ class Vector3(Vector3c, np.ndarray):
 
     @property
     def magnitude(self) -> DType:
-        return np.linalg.norm(self)
+        x, y, z = self.tolist()
+        return sqrt(x * x + y * y + z * z)
 
     @magnitude.setter
     def magnitude(self, value: DType):
-        self.__imul__(value / self.magnitude)
+        x, y, z = self.tolist()
+        length = sqrt(x * x + y * y + z * z)
+        if not length or self.dtype.kind != "f":
+            self.__imul__(np.divide(value, length))
+            return
+        scale = value / length
+        self[0] = x * scale
+        self[1] = y * scale
+        self[2] = z * scale
 
-    # noinspection PyTypeChecker
     @property
     def magnitude_sq(self) -> DType:
-        return np.dot(self, self)
+        x, y, z = self.tolist()
+        return x * x + y * y + z * z
 
     def normalize(self) -> Vector3:
         return self / self.magnitude
 
     def normalize_self(self) -> Vector3:
-        return self.__itruediv__(self.magnitude)
+        x, y, z = self.tolist()
+        length = sqrt(x * x + y * y + z * z)
+        if length and self.dtype.kind == "f":
+            inv = 1.0 / length
+            self[0] = x * inv
+            self[1] = y * inv
+            self[2] = z * inv
+            return self
+        return self.__itruediv__(length)
 
-    # noinspection PyTypeChecker
     def dot(self, other: Vector3Like) -> DType:
-        return np.dot(self, other)
+        if type(other) is Vector3:
+            other = other.tolist()
+        elif type(other) is not tuple or len(other) != 3:
+            return np.dot(self, other)
+        x, y, z = self.tolist()
+        return x * other[0] + y * other[1] + z * other[2]
 
     def cross(self, other: Vector3Like):
         return np.cross(self, other).view(Vector3)
 
     def angle_between(self, *other: Vector3Like) -> float:
-        x = self.x
-        y = self.y
-        z = self.z
-        l1_squared: float = x * x + (y * y + (z * z))
-        v = Vector3Tuple(*other)
-        l2_squared: float = v[0] * v[0] + (v[1] * v[1] + (v[2] * v[2]))
-        dot: float = x * v[0] + (y * v[1] + (z * v[2]))
-        cos: float = dot / np.sqrt(l1_squared * l2_squared)
+        x, y, z = self.tolist()
+        ox, oy, oz = Vector3Tuple(*other)
+        l1_squared: float = x * x + y * y + z * z
+        l2_squared: float = ox * ox + oy * oy + oz * oz
+        dot: float = x * ox + y * oy + z * oz
+        lengths_squared: float = l1_squared * l2_squared
+        # A zero vector has no direction, report 0.0 as the old numpy version
+        # ended up doing
+        if not lengths_squared:
+            return 0.0
+        cos: float = dot / sqrt(lengths_squared)
         # This is because sometimes cos goes above 1 or below -1 because of lost precision
-        cos = cos if cos < 1 else 1
-        cos = cos if cos > -1 else -1
-        return np.acos(cos)
+        return acos(min(1.0, max(-1.0, cos)))
 
     def distance(self, other: Vector3Like) -> float:
-        return np.linalg.norm(self - other)
+        return sqrt(self.distance_sq(other))
 
     def distance_sq(self, other: Vector3Like) -> float:
-        dx: float = self.x - other[0]
-        dy: float = self.y - other[1]
-        return dx * dx + dy * dy
+        x, y, z = self.tolist()
+        ox, oy, oz = Vector3Tuple(other)
+        dx: float = x - ox
+        dy: float = y - oy
+        dz: float = z - oz
+        return dx * dx + dy * dy + dz * dz
 
     def lerp(self, other: Vector3Like, t: float) -> Vector3:
         return (other - self) * t + self
 
-    def smooth_step(self, other: Vector2Like, t: float) -> Vector2:
+    def smooth_step(self, other: Vector3Like, t: float) -> Vector3:
         t2 = t * t
         t3 = t2 * t
-        return (
-            (self + self - other - other) * t3
-            + (3.0 * other - 3.0 * self) * t2
-            + self * t
-            + self
-        )
+        # Same polynomial as before, regrouped by endpoint so only two
+        # scaled arrays and one sum are built instead of a temporary per term
+        b = 3.0 * t2 - 2.0 * t3
+        return self * (t + 1.0 - b) + np.multiply(other, b)
 
 
 class Vector4c(ABC):
-    pass
+    __slots__ = ()
 
 
 # noinspection PyUnresolvedReferences
 class Vector4(Vector4c, np.ndarray):
+    __slots__ = ()
+
     def __new__(cls, *data, dtype: Type[DType] = float):
+        # Fast paths for the common component-wise and copy constructions,
+        # everything else goes through the full Vector4Tuple parser
+        dlen = len(data)
+        if dlen == 0:
+            return cls._make(0, 0, 0, 1, dtype)
+        if dlen == 4:
+            return cls._make(
+                _check_single(data[0]),
+                _check_single(data[1]),
+                _check_single(data[2]),
+                _check_single(data[3]),
+                dtype,
+            )
+        if dlen == 1 and isinstance(data[0], np.ndarray) and data[0].shape == (4,):
+            return np.array(data[0], dtype=dtype).view(cls)
         return np.array(Vector4Tuple(*data), dtype=dtype).view(cls)
 
+    @classmethod
+    def _make(
+        cls, x: DType, y: DType, z: DType, w: DType, dtype: Type[DType] = float
+    ) -> Vector4:
+        vector = np.empty(4, dtype=dtype).view(cls)
+        vector[0] = x
+        vector[1] = y
+        vector[2] = z
+        vector[3] = w
+        return vector
+
     def __eq__(self, other: Vector4Like) -> bool:
-        return np.all(super().__eq__(other))
+        if self is other:
+            return True
+        if type(other) is int or type(other) is float:
+            x, y, z, w = self.tolist()
+            return x == other and y == other and z == other and w == other
+        if isinstance(other, tuple) and len(other) == 4:
+            x, y, z, w = self.tolist()
+            return x == other[0] and y == other[1] and z == other[2] and w == other[3]
+        if isinstance(other, Vector4):
+            return self.tolist() == other.tolist()
+        return bool(np.all(super().__eq__(other)))
 
     def __ne__(self, other: Vector4Like) -> bool:
         return not self.__eq__(other)
 
     @property
     def x(self) -> DType:
-        return self[0]
+        return self.item(0)
 
     @x.setter
     def x(self, value: DType):
@@ -320,7 +876,7 @@ class Vector4(Vector4c, np.ndarray):
 
     @property
     def y(self) -> DType:
-        return self[1]
+        return self.item(1)
 
     @y.setter
     def y(self, value: DType):
@@ -328,7 +884,7 @@ class Vector4(Vector4c, np.ndarray):
 
     @property
     def z(self) -> DType:
-        return self[2]
+        return self.item(2)
 
     @z.setter
     def z(self, value: DType):
@@ -336,7 +892,7 @@ class Vector4(Vector4c, np.ndarray):
 
     @property
     def w(self) -> DType:
-        return self[3]
+        return self.item(3)
 
     @w.setter
     def w(self, value: DType):
@@ -344,65 +900,227 @@ class Vector4(Vector4c, np.ndarray):
 
     @property
     def magnitude(self) -> DType:
-        return np.linalg.norm(self)
+        x, y, z, w = self.tolist()
+        return sqrt(x * x + y * y + z * z + w * w)
 
     @magnitude.setter
     def magnitude(self, value: DType):
-        self.__imul__(value / self.magnitude)
+        x, y, z, w = self.tolist()
+        length = sqrt(x * x + y * y + z * z + w * w)
+        if not length or self.dtype.kind != "f":
+            self.__imul__(np.divide(value, length))
+            return
+        scale = value / length
+        self[0] = x * scale
+        self[1] = y * scale
+        self[2] = z * scale
+        self[3] = w * scale
 
-    # noinspection PyTypeChecker
     @property
     def magnitude_sq(self) -> DType:
-        return np.dot(self, self)
+        x, y, z, w = self.tolist()
+        return x * x + y * y + z * z + w * w
 
     def normalize(self) -> Vector4:
         return self / self.magnitude
 
     def normalize_self(self) -> Vector4:
-        return self.__itruediv__(self.magnitude)
+        x, y, z, w = self.tolist()
+        length = sqrt(x * x + y * y + z * z + w * w)
+        if length and self.dtype.kind == "f":
+            inv = 1.0 / length
+            self[0] = x * inv
+            self[1] = y * inv
+            self[2] = z * inv
+            self[3] = w * inv
+            return self
+        return self.__itruediv__(length)
 
-    # noinspection PyTypeChecker
     def dot(self, other: Vector4Like) -> DType:
-        return np.dot(self, other)
+        if type(other) is Vector4:
+            other = other.tolist()
+        elif type(other) is not tuple or len(other) != 4:
+            return np.dot(self, other)
+        x, y, z, w = self.tolist()
+        return x * other[0] + y * other[1] + z * other[2] + w * other[3]
 
     def cross(self, other: Vector4Like):
         return np.cross(self, other).view(Vector4)
 
     def angle_between(self, *other: Vector4Like) -> float:
-        x = self.x
-        y = self.y
-        z = self.z
-        w = self.w
-        l1_squared: float = x * x + (y * y + (z * z + (w * w)))
-        v = Vector4.to_tuple(*other)
-        l2_squared: float = v[0] * v[0] + (v[1] * v[1] + (v[2] * v[2] + (v[3] * v[3])))
-        dot: float = x * v[0] + (y * v[1] + (z * v[2] + (w * v[3])))
-        cos: float = dot / np.sqrt(l1_squared * l2_squared)
+        x, y, z, w = self.tolist()
+        ox, oy, oz, ow = Vector4Tuple(*other)
+        l1_squared: float = x * x + y * y + z * z + w * w
+        l2_squared: float = ox * ox + oy * oy + oz * oz + ow * ow
+        dot: float = x * ox + y * oy + z * oz + w * ow
+        lengths_squared: float = l1_squared * l2_squared
+        if not lengths_squared:
+            return 0.0
+        cos: float = dot / sqrt(lengths_squared)
         # This is because sometimes cos goes above 1 or below -1 because of lost precision
-        cos = cos if cos < 1 else 1
-        cos = cos if cos > -1 else -1
-        return np.acos(cos)
+        return acos(min(1.0, max(-1.0, cos)))
 
     def distance(self, other: Vector4Like) -> float:
-        return np.linalg.norm(self - other)
+        return sqrt(self.distance_sq(other))
 
     def distance_sq(self, other: Vector4Like) -> float:
-        dx: float = self.x - other[0]
-        dy: float = self.y - other[1]
-        return dx * dx + dy * dy
+        x, y, z, w = self.tolist()
+        # Vector4Tuple(scalar) fills w with 1, a scalar offsets every component
+        if type(other) is int or type(other) is float:
+            ox = oy = oz = ow = other
+        else:
+            ox, oy, oz, ow = Vector4Tuple(other)
+        dx: float = x - ox
+        dy: float = y - oy
+        dz: float = z - oz
+        dw: float = w - ow
+        return dx * dx + dy * dy + dz * dz + dw * dw
 
     def lerp(self, other: Vector4Like, t: float) -> Vector4:
         return (other - self) * t + self
 
-    def smooth_step(self, other: Vector2Like, t: float) -> Vector2:
+    def smooth_step(self, other: Vector4Like, t: float) -> Vector4:
         t2 = t * t
         t3 = t2 * t
-        return (
-            (self + self - other - other) * t3
-            + (3.0 * other - 3.0 * self) * t2
-            + self * t
-            + self
-        )
+        # Same polynomial as before, regrouped by endpoint so only two
+        # scaled arrays and one sum are built instead of a temporary per term
+        b = 3.0 * t2 - 2.0 * t3
+        return self * (t + 1.0 - b) + np.multiply(other, b)
+
+
+# Structure-of-arrays store. Each field of the stored type is a contiguous
+# row of one (fields, capacity) buffer, so batch math can run on whole rows,
+# e.g. np.add(a.x, b.x, out=a.x), instead of one Python object per element.
+# Subclasses set the field count, the element type built by indexing and the
+# tuple parser used by append. Shared by the vector arrays and shape.AABB2Array.
+class _SoAArray:
+    __slots__ = ("_data", "_len")
+
+    _components: int
+    _item: type
+    _tuple: type
+
+    def __init__(self, capacity: int = 0, dtype: Type[DType] = float):
+        self._data: np.ndarray = np.empty((self._components, capacity), dtype=dtype)
+        self._len: int = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={self._len}, dtype={self.dtype})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(self._data[:, index], dtype=self.dtype)
+
+    def __iter__(self):
+        for index in range(self._len):
+            yield self[index]
+
+    @property
+    def dtype(self) -> Type[DType]:
+        return self._data.dtype.type
+
+    def append(self, value) -> None:
+        capacity = self._data.shape[1]
+        if self._len == capacity:
+            data = np.empty(
+                (self._components, max(8, capacity * 2)), dtype=self._data.dtype
+            )
+            data[:, :capacity] = self._data
+            self._data = data
+        self._data[:, self._len] = self._tuple(value)
+        self._len += 1
+
+    def _rows(self) -> np.ndarray:
+        return self._data[:, : self._len]
+
+
+class _VectorArray(_SoAArray):
+    __slots__ = ()
+
+    # Dot product of every vector pair, reduced over the component rows in one
+    # einsum call rather than one Vector.dot call per element
+    def dot(self, other: _VectorArray) -> np.ndarray:
+        if self._len != other._len:
+            raise ValueError(f"Length mismatch: {self._len} != {other._len}")
+        return np.einsum("ij,ij->j", self._rows(), other._rows())
+
+
+class Vector2Array(_VectorArray):
+    __slots__ = ()
+
+    _components = 2
+    _item = Vector2
+    _tuple = Vector2Tuple
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._data[0, : self._len]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._data[1, : self._len]
+
+
+class Vector3Array(_VectorArray):
+    __slots__ = ()
+
+    _components = 3
+    _item = Vector3
+    _tuple = Vector3Tuple
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._data[0, : self._len]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._data[1, : self._len]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self._data[2, : self._len]
+
+    def cross(self, other: Vector3Array) -> Vector3Array:
+        if self._len != other._len:
+            raise ValueError(f"Length mismatch: {self._len} != {other._len}")
+        ax, ay, az = self._rows()
+        bx, by, bz = other._rows()
+        result = Vector3Array(self._len, dtype=np.result_type(self._data, other._data))
+        result._data[0] = ay * bz - az * by
+        result._data[1] = az * bx - ax * bz
+        result._data[2] = ax * by - ay * bx
+        result._len = self._len
+        return result
+
+
+class Vector4Array(_VectorArray):
+    __slots__ = ()
+
+    _components = 4
+    _item = Vector4
+    _tuple = Vector4Tuple
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._data[0, : self._len]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._data[1, : self._len]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self._data[2, : self._len]
+
+    @property
+    def w(self) -> np.ndarray:
+        return self._data[3, : self._len]
 
 
 Vector2Like = Union[Vector2Tuple, Vector2c, np.ndarray, DType, Iterable[DType]]
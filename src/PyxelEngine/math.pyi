@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Iterable, Tuple, Type, Union, overload
+from typing import Iterable, Iterator, Tuple, Type, Union, overload
 
 import numpy as np
 
@@ -10,10 +10,14 @@ __all__ = [
     "Vector4Tuple",
     "Vector2c",
     "Vector2",
+    "ValueVector2",
     "Vector3c",
     "Vector3",
     "Vector4c",
     "Vector4",
+    "Vector2Array",
+    "Vector3Array",
+    "Vector4Array",
     "Vector2Like",
     "Vector3Like",
     "Vector4Like",
@@ -140,6 +144,8 @@ class Vector2(Vector2c, np.ndarray):
     def __idivmod__(self, other: Vector2Like) -> Vector2: ...
     def __ipow__(self, other: Vector2Like) -> Vector2: ...
     def __imatmul__(self, other: Vector2Like) -> Vector2: ...
+    @classmethod
+    def _make(cls, x: DType, y: DType, dtype: Type[DType] = float) -> Vector2: ...
     def astype(
         self, dtype: Type[DType], order="K", casting="unsafe", subok=True, copy=True
     ) -> Vector2: ...
@@ -158,6 +164,50 @@ class Vector2(Vector2c, np.ndarray):
     def normalize_self(self) -> Vector2: ...
     def perpendicular_self(self) -> Vector2: ...
 
+class ValueVector2(Vector2c):
+    x: DType
+    y: DType
+    @overload
+    def __init__(self, x: DType, y: DType, dtype: Type[DType] = float) -> None: ...
+    @overload
+    def __init__(self, xy: DType, dtype: Type[DType] = float) -> None: ...
+    @overload
+    def __init__(self, xy: Vector2Like, dtype: Type[DType] = float) -> None: ...
+    @overload
+    def __init__(self, dtype: Type[DType] = float) -> None: ...
+    @classmethod
+    def _make(cls, x: DType, y: DType, dtype: Type[DType]) -> ValueVector2: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[DType]: ...
+    def __getitem__(self, index: int) -> DType: ...
+    def __array__(self, dtype=None, copy=None) -> np.ndarray: ...
+    def __neg__(self) -> ValueVector2: ...
+    def __add__(self, other: Vector2Like) -> ValueVector2: ...
+    def __radd__(self, other: Vector2Like) -> ValueVector2: ...
+    def __iadd__(self, other: Vector2Like) -> ValueVector2: ...
+    def __sub__(self, other: Vector2Like) -> ValueVector2: ...
+    def __rsub__(self, other: Vector2Like) -> ValueVector2: ...
+    def __isub__(self, other: Vector2Like) -> ValueVector2: ...
+    def __mul__(self, other: Vector2Like) -> ValueVector2: ...
+    def __rmul__(self, other: Vector2Like) -> ValueVector2: ...
+    def __imul__(self, other: Vector2Like) -> ValueVector2: ...
+    def __truediv__(self, other: Vector2Like) -> ValueVector2: ...
+    def astype(self, dtype: Type[DType], copy: bool = True) -> ValueVector2: ...
+    def tolist(self) -> list: ...
+    @property
+    def dtype(self) -> np.dtype: ...
+    @property
+    def magnitude(self) -> DType: ...
+    @property
+    def magnitude_sq(self) -> DType: ...
+    def normalize(self) -> ValueVector2: ...
+    def perpendicular(self) -> ValueVector2: ...
+    def perpendicular_self(self) -> ValueVector2: ...
+    def dot(self, other: Vector2Like) -> DType: ...
+    def distance(self, other: Vector2Like) -> float: ...
+    def distance_sq(self, other: Vector2Like) -> float: ...
+    def lerp(self, other: Vector2Like, t: float) -> ValueVector2: ...
+
 class Vector3c(ABC):
     def __eq__(self, other: Vector3Like) -> bool: ...
     def __ne__(self, other: Vector3Like) -> bool: ...
@@ -227,6 +277,10 @@ class Vector3(Vector3c, np.ndarray):
     def __idivmod__(self, other: Vector3Like) -> Vector3: ...
     def __ipow__(self, other: Vector3Like) -> Vector3: ...
     def __imatmul__(self, other: Vector3Like) -> Vector3: ...
+    @classmethod
+    def _make(
+        cls, x: DType, y: DType, z: DType, dtype: Type[DType] = float
+    ) -> Vector3: ...
     def astype(
         self, dtype: Type[DType], order="K", casting="unsafe", subok=True, copy=True
     ) -> Vector3: ...
@@ -284,7 +338,7 @@ class Vector4c(ABC):
     def normalize(self) -> Vector4: ...
     def dot(self, other: Vector4Like) -> DType: ...
     def cross(self, other: Vector4Like) -> Vector4: ...
-    def angle_between(self, other: Vector3Like) -> float: ...
+    def angle_between(self, other: Vector4Like) -> float: ...
     def distance(self, other: Vector4Like) -> float: ...
     def distance_sq(self, other: Vector4Like) -> float: ...
     def lerp(self, other: Vector4Like, t: float) -> Vector4: ...
@@ -325,6 +379,10 @@ class Vector4(Vector4c, np.ndarray):
     def __idivmod__(self, other: Vector4Like) -> Vector4: ...
     def __ipow__(self, other: Vector4Like) -> Vector4: ...
     def __imatmul__(self, other: Vector4Like) -> Vector4: ...
+    @classmethod
+    def _make(
+        cls, x: DType, y: DType, z: DType, w: DType, dtype: Type[DType] = float
+    ) -> Vector4: ...
     def astype(
         self, dtype: Type[DType], order="K", casting="unsafe", subok=True, copy=True
     ) -> Vector4: ...
@@ -350,6 +408,55 @@ class Vector4(Vector4c, np.ndarray):
     def magnitude(self, value: DType): ...
     def normalize_self(self) -> Vector4: ...
 
+class Vector2Array:
+    def __init__(self, capacity: int = 0, dtype: Type[DType] = float) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Vector2: ...
+    def __iter__(self) -> Iterator[Vector2]: ...
+    @property
+    def dtype(self) -> Type[DType]: ...
+    @property
+    def x(self) -> np.ndarray: ...
+    @property
+    def y(self) -> np.ndarray: ...
+    def append(self, vector: Vector2Like) -> None: ...
+    def dot(self, other: Vector2Array) -> np.ndarray: ...
+
+class Vector3Array:
+    def __init__(self, capacity: int = 0, dtype: Type[DType] = float) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Vector3: ...
+    def __iter__(self) -> Iterator[Vector3]: ...
+    @property
+    def dtype(self) -> Type[DType]: ...
+    @property
+    def x(self) -> np.ndarray: ...
+    @property
+    def y(self) -> np.ndarray: ...
+    @property
+    def z(self) -> np.ndarray: ...
+    def append(self, vector: Vector3Like) -> None: ...
+    def dot(self, other: Vector3Array) -> np.ndarray: ...
+    def cross(self, other: Vector3Array) -> Vector3Array: ...
+
+class Vector4Array:
+    def __init__(self, capacity: int = 0, dtype: Type[DType] = float) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Vector4: ...
+    def __iter__(self) -> Iterator[Vector4]: ...
+    @property
+    def dtype(self) -> Type[DType]: ...
+    @property
+    def x(self) -> np.ndarray: ...
+    @property
+    def y(self) -> np.ndarray: ...
+    @property
+    def z(self) -> np.ndarray: ...
+    @property
+    def w(self) -> np.ndarray: ...
+    def append(self, vector: Vector4Like) -> None: ...
+    def dot(self, other: Vector4Array) -> np.ndarray: ...
+
 Vector2Like = Union[Vector2Tuple, Vector2c, np.ndarray, DType, Iterable[DType]]
 Vector3Like = Union[Vector3Tuple, Vector3c, np.ndarray, DType, Iterable[DType]]
 Vector4Like = Union[Vector4Tuple, Vector4c, np.ndarray, DType, Iterable[DType]]
@@ -1,6 +1,11 @@
 import random as _random
+from math import cos
+from math import sin
+from math import tau
 from typing import Callable, Literal, TypeVar, Union
 
+import numpy as np
+
 from PyxelEngine.math import Vector2
 from PyxelEngine.math import Vector3
 from PyxelEngine.math import Vector4
@@ -9,27 +14,76 @@ T = TypeVar("T", int, float)
 
 
 class Random(_random.Random):
-    def _rand_dir(self):
-        return self.random() * 2.0 - 1.0
+    def __init__(self, x=None):
+        self._np_rng: np.random.Generator = np.random.default_rng()
+        super().__init__(x)
+
+    def seed(self, a=None, version=2) -> None:
+        super().seed(a, version)
+        self._seed_np_rng()
+
+    # The state covers both generators so setstate(getstate()) also replays
+    # randvec_batch. A plain random.Random state is accepted too, the NumPy
+    # generator is then derived from it the same way seed() does.
+    def getstate(self) -> tuple:
+        return super().getstate(), self._np_rng.bit_generator.state
+
+    def setstate(self, state: tuple) -> None:
+        if len(state) == 2:
+            state, np_state = state
+            super().setstate(state)
+            self._np_rng.bit_generator.state = np_state
+        else:
+            super().setstate(state)
+            self._seed_np_rng()
+
+    def _seed_np_rng(self) -> None:
+        # Derive the NumPy generator from the current state without advancing
+        # it, so the scalar stream matches random.Random's
+        state = super().getstate()
+        self._np_rng = np.random.default_rng(self.getrandbits(128))
+        super().setstate(state)
 
     def randvec2(self, out: Vector2 = None) -> Vector2:
+        angle = tau * self.random()
         if out is None:
-            out = Vector2(dtype=float)
-        out[:] = self._rand_dir(), self._rand_dir()
-        return out.normalize_self()
+            return Vector2._make(cos(angle), sin(angle))
+        out[0] = cos(angle)
+        out[1] = sin(angle)
+        return out
 
     def randvec3(self, out: Vector3 = None) -> Vector3:
+        x, y, z = self.gauss(0.0, 1.0), self.gauss(0.0, 1.0), self.gauss(0.0, 1.0)
         if out is None:
-            out = Vector3(dtype=float)
-        out[:] = self._rand_dir(), self._rand_dir(), self._rand_dir()
+            return Vector3._make(x, y, z).normalize_self()
+        out[0] = x
+        out[1] = y
+        out[2] = z
         return out.normalize_self()
 
     def randvec4(self, out: Vector4 = None) -> Vector4:
+        x, y = self.gauss(0.0, 1.0), self.gauss(0.0, 1.0)
+        z, w = self.gauss(0.0, 1.0), self.gauss(0.0, 1.0)
         if out is None:
-            out = Vector4(dtype=float)
-        out[:] = self._rand_dir(), self._rand_dir(), self._rand_dir(), self._rand_dir()
+            return Vector4._make(x, y, z, w).normalize_self()
+        out[0] = x
+        out[1] = y
+        out[2] = z
+        out[3] = w
         return out.normalize_self()
 
+    def randvec_batch(self, n: int, dim: int, out: np.ndarray = None) -> np.ndarray:
+        if out is None:
+            out = self._np_rng.standard_normal((n, dim))
+        else:
+            if out.shape != (n, dim):
+                raise ValueError(f"out must have shape {(n, dim)}, not {out.shape}")
+            if out.dtype not in (np.float32, np.float64):
+                raise TypeError(f"out must be float32 or float64, not {out.dtype}")
+            self._np_rng.standard_normal(out=out, dtype=out.dtype)
+        out /= np.sqrt(np.einsum("ij,ij->i", out, out))[:, None]
+        return out
+
 
 _inst = Random()
 
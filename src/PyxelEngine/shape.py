@@ -2,7 +2,17 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
-from typing import Iterable, Tuple, Type, TypeVar, Union, overload
+from functools import singledispatch
+from typing import (
+    Iterable,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import numpy as np
 
@@ -15,6 +25,8 @@ from PyxelEngine.math import Vector3
 from PyxelEngine.math import Vector3c
 from PyxelEngine.math import Vector3Like
 from PyxelEngine.math import Vector3Tuple
+from PyxelEngine.math import _check_single
+from PyxelEngine.math import _SoAArray
 
 __all__ = [
     "AABB2Tuple",
@@ -27,20 +39,54 @@ __all__ = [
     "AABB3c",
     "AABB2",
     "AABB3",
+    "AABB2Array",
     "AABB2Like",
     "AABB3Like",
+    "intersects_batch",
 ]
 
 T = TypeVar("T", bound=DType)
 
 
-def _check_single(value: DType) -> DType:
-    if isinstance(value, Iterable):
-        raise TypeError("Invalid Arguments Provided")
-    return value
+# Argument type signatures already seen to hold only scalars. A repeat call
+# with the same signature skips the per-value Iterable check.
+_flat_signatures: Set[Tuple[type, ...]] = set()
+
+
+def _check_flat(data: Sequence[DType]) -> Tuple[DType, ...]:
+    signature = tuple(map(type, data))
+    if signature not in _flat_signatures:
+        for value in data:
+            _check_single(value)
+        _flat_signatures.add(signature)
+    return tuple(data)
+
+
+# Single argument parsing for AABB2Tuple, dispatched on the argument type so
+# the common tuple and ndarray inputs skip the isinstance chain
+@singledispatch
+def _aabb2_single(data) -> Tuple[DType, ...]:
+    if isinstance(data, Iterable):
+        return AABB2Tuple(*data)
+    raise TypeError("Invalid Arguments Provided")
 
 
-class AABB2Tuple(Tuple[Tuple[DType, DType], Tuple[DType, DType]]):
+@_aabb2_single.register(tuple)
+@_aabb2_single.register(list)
+def _(data) -> Tuple[DType, ...]:
+    if len(data) == 4:
+        return _check_flat(data)
+    return AABB2Tuple(*data)
+
+
+@_aabb2_single.register(np.ndarray)
+def _(data: np.ndarray) -> Tuple[DType, ...]:
+    if data.shape == (4,):
+        return tuple(data.tolist())
+    return _aabb2_single(data.tolist())
+
+
+class AABB2Tuple(Tuple[DType, DType, DType, DType]):
     @overload
     def __new__(cls) -> AABB2Tuple:
         ...
@@ -68,29 +114,27 @@ class AABB2Tuple(Tuple[Tuple[DType, DType], Tuple[DType, DType]]):
     def __new__(cls, *data) -> AABB2Tuple:
         dlen = len(data)
         if dlen == 0:
-            return super().__new__(cls, ((0, 0), (1, 1)))
+            return super().__new__(cls, (0, 0, 1, 1))
         if dlen == 1:
-            if isinstance(data[0], AABB2c):
-                return AABB2Tuple.__new__(cls, data[0].pos, data[0].size)
-            if isinstance(data[0], Iterable):
-                return AABB2Tuple.__new__(cls, *data[0])
-            raise TypeError("Invalid Arguments Provided")
+            return super().__new__(cls, _aabb2_single(data[0]))
         if dlen == 2:
             return super().__new__(
-                cls, (Vector2Tuple(*data[0]), Vector2Tuple(*data[1]))
+                cls, (*Vector2Tuple(*data[0]), *Vector2Tuple(*data[1]))
             )
         if dlen == 4:
-            return super().__new__(
-                cls,
-                (
-                    (_check_single(data[0]), _check_single(data[1])),
-                    (_check_single(data[2]), _check_single(data[3])),
-                ),
-            )
+            return super().__new__(cls, _check_flat(data))
         raise TypeError("Invalid Arguments Provided")
 
+    @property
+    def pos(self) -> Tuple[DType, DType]:
+        return self[0], self[1]
+
+    @property
+    def size(self) -> Tuple[DType, DType]:
+        return self[2], self[3]
+
 
-class AABB3Tuple(Tuple[Tuple[DType, DType, DType], Tuple[DType, DType, DType]]):
+class AABB3Tuple(Tuple[DType, DType, DType, DType, DType, DType]):
     @overload
     def __new__(cls) -> AABB3Tuple:
         ...
@@ -120,8 +164,10 @@ class AABB3Tuple(Tuple[Tuple[DType, DType, DType], Tuple[DType, DType, DType]]):
     def __new__(cls, *data) -> AABB3Tuple:
         dlen = len(data)
         if dlen == 0:
-            return super().__new__(cls, ((0, 0, 0), (1, 1, 1)))
+            return super().__new__(cls, (0, 0, 0, 1, 1, 1))
         if dlen == 1:
+            if isinstance(data[0], np.ndarray) and data[0].shape == (6,):
+                return super().__new__(cls, data[0].tolist())
             if isinstance(data[0], AABB3c):
                 return AABB3Tuple.__new__(cls, data[0].pos, data[0].size)
             if isinstance(data[0], Iterable):
@@ -129,29 +175,25 @@ class AABB3Tuple(Tuple[Tuple[DType, DType, DType], Tuple[DType, DType, DType]]):
             raise TypeError("Invalid Arguments Provided")
         if dlen == 2:
             return super().__new__(
-                cls, (Vector3Tuple(*data[0]), Vector3Tuple(*data[1]))
+                cls, (*Vector3Tuple(*data[0]), *Vector3Tuple(*data[1]))
             )
         if dlen == 6:
-            return super().__new__(
-                cls,
-                (
-                    (
-                        _check_single(data[0]),
-                        _check_single(data[1]),
-                        _check_single(data[2]),
-                    ),
-                    (
-                        _check_single(data[3]),
-                        _check_single(data[4]),
-                        _check_single(data[5]),
-                    ),
-                ),
-            )
+            return super().__new__(cls, _check_flat(data))
         raise TypeError("Invalid Arguments Provided")
 
+    @property
+    def pos(self) -> Tuple[DType, DType, DType]:
+        return self[0], self[1], self[2]
+
+    @property
+    def size(self) -> Tuple[DType, DType, DType]:
+        return self[3], self[4], self[5]
+
 
 # noinspection PyPropertyDefinition
 class Shape2c(ABC):
+    __slots__ = ()
+
     @property
     def dtype(self) -> Type[DType]:
         ...
@@ -184,9 +226,15 @@ class Shape2c(ABC):
     def test_point(self, pos: Vector2Like) -> bool:
         ...
 
+    @abstractmethod
+    def test_points(self, pos: np.ndarray) -> np.ndarray:
+        ...
+
 
 # noinspection PyPropertyDefinition
 class Shape3c(ABC):
+    __slots__ = ()
+
     @property
     def dtype(self) -> Type[DType]:
         ...
@@ -223,8 +271,14 @@ class Shape3c(ABC):
     def test_point(self, pos: Vector3Like) -> bool:
         ...
 
+    @abstractmethod
+    def test_points(self, pos: np.ndarray) -> np.ndarray:
+        ...
+
 
 class Shape2(Shape2c, ABC):
+    __slots__ = ("_pos", "_dtype")
+
     def __init__(self, pos: Vector2Like = (0, 0), dtype: Type[DType] = float):
         self._pos: Vector2 = Vector2(pos, dtype=dtype)
         self._dtype: Type[DType] = dtype
@@ -265,6 +319,8 @@ class Shape2(Shape2c, ABC):
 
 
 class Shape3(Shape3c, ABC):
+    __slots__ = ("_pos", "_dtype")
+
     def __init__(self, pos: Vector3Like = (0, 0, 0), dtype: Type[DType] = float):
         self._pos: Vector3 = Vector3(pos, dtype=dtype)
         self._dtype: Type[DType] = dtype
@@ -310,6 +366,8 @@ class Shape3(Shape3c, ABC):
 
 # noinspection PyPropertyDefinition
 class AABB2c(Shape2c, ABC):
+    __slots__ = ()
+
     @property
     def size(self) -> Vector2c:
         ...
@@ -347,8 +405,15 @@ class AABB2c(Shape2c, ABC):
         ...
 
 
+@_aabb2_single.register(AABB2c)
+def _(data: AABB2c) -> Tuple[DType, ...]:
+    return data.x, data.y, data.width, data.height
+
+
 # noinspection PyPropertyDefinition
 class AABB3c(Shape3c, ABC):
+    __slots__ = ()
+
     @property
     def size(self) -> Vector3c:
         ...
@@ -399,6 +464,8 @@ class AABB3c(Shape3c, ABC):
 
 
 class AABB2(Shape2, AABB2c):
+    __slots__ = ("_size", "_min", "_max")
+
     @overload
     def __init__(self, dtype: Type[DType] = float):
         ...
@@ -434,11 +501,18 @@ class AABB2(Shape2, AABB2c):
 
     # noinspection PyTypeChecker
     def __init__(self, *data, dtype: Type[DType] = float):
-        pos, size = AABB2Tuple(data)
+        if len(data) == 1 and isinstance(data[0], AABB2):
+            # Copy construction copies the other box's vectors directly
+            # instead of flattening it through AABB2Tuple
+            super().__init__(pos=data[0]._pos, dtype=dtype)
+
+            self._size: Vector2 = Vector2(data[0]._size, dtype=dtype)
+        else:
+            x, y, w, h = AABB2Tuple(data)
 
-        super().__init__(pos=pos, dtype=dtype)
+            super().__init__(pos=(x, y), dtype=dtype)
 
-        self._size: Vector2 = Vector2(size, dtype=dtype)
+            self._size: Vector2 = Vector2(w, h, dtype=dtype)
         self._min: Vector2 = Vector2(dtype=dtype)
         self._max: Vector2 = Vector2(dtype=dtype)
 
@@ -455,13 +529,26 @@ class AABB2(Shape2, AABB2c):
     ) -> AABB2:
         if copy:
             return AABB2(self, dtype=dtype)
+        # ndarray.astype(copy=False) hands back the same vector when the dtype
+        # already matches, so an in-place no-op conversion allocates nothing
         self._dtype: Type[DType] = dtype
-        self._pos = self._pos.astype(dtype=dtype)
-        self._size = self._size.astype(dtype=dtype)
-        self._min = self._min.astype(dtype=dtype)
-        self._max = self._max.astype(dtype=dtype)
+        self._pos = self._pos.astype(dtype=dtype, copy=False)
+        self._size = self._size.astype(dtype=dtype, copy=False)
+        self._min = self._min.astype(dtype=dtype, copy=False)
+        self._max = self._max.astype(dtype=dtype, copy=False)
         return self
 
+    # (min_x, min_y, max_x, max_y) as Python scalars. pos and size are live
+    # vectors that callers mutate in place, so this is read fresh every time
+    # rather than cached.
+    @property
+    def _bounds(self) -> Tuple[DType, DType, DType, DType]:
+        x, y = self._pos.tolist()
+        w, h = self._size.tolist()
+        min_x, max_x = (x, x + w) if w >= 0 else (x + w, x)
+        min_y, max_y = (y, y + h) if h >= 0 else (y + h, y)
+        return min_x, min_y, max_x, max_y
+
     @property
     def size(self) -> Vector2:
         return self._size
@@ -485,11 +572,13 @@ class AABB2(Shape2, AABB2c):
 
     @property
     def min_x(self):
-        return min(self.x, self.x + self.width)
+        x, w = self._pos.item(0), self._size.item(0)
+        return x if w >= 0 else x + w
 
     @property
     def min_y(self):
-        return min(self.y, self.y + self.height)
+        y, h = self._pos.item(1), self._size.item(1)
+        return y if h >= 0 else y + h
 
     @property
     def max(self) -> Vector2c:
@@ -498,40 +587,104 @@ class AABB2(Shape2, AABB2c):
 
     @property
     def max_x(self):
-        return max(self.x, self.x + self.width)
+        x, w = self._pos.item(0), self._size.item(0)
+        return x + w if w >= 0 else x
 
     @property
     def max_y(self):
-        return max(self.y, self.y + self.height)
+        y, h = self._pos.item(1), self._size.item(1)
+        return y + h if h >= 0 else y
 
     @property
     def aabb(self) -> AABB2c:
         return self
 
     def intersects(self, other: AABB2Like) -> bool:
-        (x, y), (w, h) = AABB2Tuple(other)
-        return not (
-            self.max_x <= min(x, x + w)
-            or self.min_x > max(x, x + w)
-            or self.max_y <= min(y, y + h)
-            or self.min_y > max(y, y + h)
+        if isinstance(other, AABB2):
+            other_min_x, other_min_y, other_max_x, other_max_y = other._bounds
+        else:
+            x, y, w, h = AABB2Tuple(other)
+            other_min_x, other_max_x = (x, x + w) if w >= 0 else (x + w, x)
+            other_min_y, other_max_y = (y, y + h) if h >= 0 else (y + h, y)
+        min_x, min_y, max_x, max_y = self._bounds
+        return (
+            max_x > other_min_x
+            and min_x <= other_max_x
+            and max_y > other_min_y
+            and min_y <= other_max_y
         )
 
     def contains(self, other: AABB2Like) -> bool:
-        (x, y), (w, h) = AABB2Tuple(other)
+        x, y, w, h = AABB2Tuple(other)
+        min_x, min_y, max_x, max_y = self._bounds
         return (
-            self.min_x <= min(x, x + w)
-            and self.max_x >= max(x, x + w)
-            and self.min_y <= min(y, y + h)
-            and self.max_y >= max(y, y + h)
+            min_x <= min(x, x + w)
+            and max_x >= max(x, x + w)
+            and min_y <= min(y, y + h)
+            and max_y >= max(y, y + h)
         )
 
     def test_point(self, pos: Vector2Like) -> bool:
         x, y = Vector2Tuple(pos)
-        return self.min_x <= x < self.max_x and self.min_y <= y < self.max_y
+        min_x, min_y, max_x, max_y = self._bounds
+        return min_x <= x < max_x and min_y <= y < max_y
+
+    def test_points(self, pos: np.ndarray) -> np.ndarray:
+        pos = np.asarray(pos)
+        x = pos[..., 0]
+        y = pos[..., 1]
+        min_x, min_y, max_x, max_y = self._bounds
+        return (x >= min_x) & (x < max_x) & (y >= min_y) & (y < max_y)
+
+    # Slab test: clip the segment's parameter range [0, 1] against the x and
+    # y slabs of the box in turn, the box edges count as inside
+    def intersects_segment(self, start: Vector2Like, end: Vector2Like) -> bool:
+        x0, y0 = Vector2Tuple(start)
+        x1, y1 = Vector2Tuple(end)
+        min_x, min_y, max_x, max_y = self._bounds
+        t_min, t_max = 0.0, 1.0
+        for p, d, lo, hi in ((x0, x1 - x0, min_x, max_x), (y0, y1 - y0, min_y, max_y)):
+            if d == 0:
+                if p < lo or p > hi:
+                    return False
+                continue
+            t_lo = (lo - p) / d
+            t_hi = (hi - p) / d
+            if t_lo > t_hi:
+                t_lo, t_hi = t_hi, t_lo
+            t_min = max(t_min, t_lo)
+            t_max = min(t_max, t_hi)
+            if t_min > t_max:
+                return False
+        return True
+
+    def intersects_segments(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        start = np.asarray(start, dtype=float)
+        delta = np.asarray(end, dtype=float) - start
+        min_x, min_y, max_x, max_y = self._bounds
+        lo = np.array((min_x, min_y), dtype=float)
+        hi = np.array((max_x, max_y), dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_a = (lo - start) / delta
+            t_b = (hi - start) / delta
+        # Axes the segment does not move along either always overlap the slab
+        # or never do, depending on where the segment sits
+        parallel = delta == 0
+        inside = (start >= lo) & (start <= hi)
+        t_lo = np.where(
+            parallel, np.where(inside, -np.inf, np.inf), np.minimum(t_a, t_b)
+        )
+        t_hi = np.where(
+            parallel, np.where(inside, np.inf, -np.inf), np.maximum(t_a, t_b)
+        )
+        t_min = np.maximum(t_lo.max(axis=-1), 0.0)
+        t_max = np.minimum(t_hi.min(axis=-1), 1.0)
+        return t_min <= t_max
 
 
 class AABB3(Shape3, AABB3c):
+    __slots__ = ("_size", "_min", "_max")
+
     @overload
     def __init__(self, dtype: Type[DType] = float):
         ...
@@ -569,11 +722,18 @@ class AABB3(Shape3, AABB3c):
 
     # noinspection PyTypeChecker
     def __init__(self, *data, dtype: Type[DType] = float):
-        pos, size = AABB3Tuple(data)
+        if len(data) == 1 and isinstance(data[0], AABB3):
+            # Copy construction copies the other box's vectors directly
+            # instead of flattening it through AABB3Tuple
+            super().__init__(pos=data[0]._pos, dtype=dtype)
+
+            self._size: Vector3 = Vector3(data[0]._size, dtype=dtype)
+        else:
+            x, y, z, w, h, d = AABB3Tuple(data)
 
-        super().__init__(pos=pos, dtype=dtype)
+            super().__init__(pos=(x, y, z), dtype=dtype)
 
-        self._size: Vector3 = Vector3(size, dtype=dtype)
+            self._size: Vector3 = Vector3(w, h, d, dtype=dtype)
         self._min: Vector3 = Vector3(dtype=dtype)
         self._max: Vector3 = Vector3(dtype=dtype)
 
@@ -591,10 +751,10 @@ class AABB3(Shape3, AABB3c):
         if copy:
             return AABB3(self, dtype=dtype)
         self._dtype: Type[DType] = dtype
-        self._pos = self._pos.astype(dtype=dtype)
-        self._size = self._size.astype(dtype=dtype)
-        self._min = self._min.astype(dtype=dtype)
-        self._max = self._max.astype(dtype=dtype)
+        self._pos = self._pos.astype(dtype=dtype, copy=False)
+        self._size = self._size.astype(dtype=dtype, copy=False)
+        self._min = self._min.astype(dtype=dtype, copy=False)
+        self._max = self._max.astype(dtype=dtype, copy=False)
         return self
 
     @property
@@ -656,7 +816,7 @@ class AABB3(Shape3, AABB3c):
         return self
 
     def intersects(self, other: AABB3Like) -> bool:
-        (x, y, z), (w, h, d) = AABB3Tuple(other)
+        x, y, z, w, h, d = AABB3Tuple(other)
         return not (
             self.max_x <= min(x, x + w)
             or self.min_x > max(x, x + w)
@@ -667,7 +827,7 @@ class AABB3(Shape3, AABB3c):
         )
 
     def contains(self, other: AABB3Like) -> bool:
-        (x, y, z), (w, h, d) = AABB3Tuple(other)
+        x, y, z, w, h, d = AABB3Tuple(other)
         return (
             self.min_x <= min(x, x + w)
             and self.max_x >= max(x, x + w)
@@ -685,6 +845,20 @@ class AABB3(Shape3, AABB3c):
             and self.min_z <= z < self.max_z
         )
 
+    def test_points(self, pos: np.ndarray) -> np.ndarray:
+        pos = np.asarray(pos)
+        x = pos[..., 0]
+        y = pos[..., 1]
+        z = pos[..., 2]
+        return (
+            (x >= self.min_x)
+            & (x < self.max_x)
+            & (y >= self.min_y)
+            & (y < self.max_y)
+            & (z >= self.min_z)
+            & (z < self.max_z)
+        )
+
 
 AABB2Like = Union[
     AABB2Tuple, AABB2c, np.ndarray, Iterable[DType], Iterable[Iterable[DType]]
@@ -692,3 +866,53 @@ AABB2Like = Union[
 AABB3Like = Union[
     AABB3Tuple, AABB3c, np.ndarray, Iterable[DType], Iterable[Iterable[DType]]
 ]
+
+
+def _bounds_batch(xywh: np.ndarray) -> Tuple[np.ndarray, ...]:
+    x, y, w, h = np.moveaxis(np.asarray(xywh), -1, 0)
+    x2 = x + w
+    y2 = y + h
+    return np.minimum(x, x2), np.minimum(y, y2), np.maximum(x, x2), np.maximum(y, y2)
+
+
+# Vectorized AABB2.intersects over (..., 4) arrays of (x, y, width, height).
+# The inputs broadcast, so a[:, None] and b[None] give every pair.
+def intersects_batch(a_xywh: np.ndarray, b_xywh: np.ndarray) -> np.ndarray:
+    a_min_x, a_min_y, a_max_x, a_max_y = _bounds_batch(a_xywh)
+    b_min_x, b_min_y, b_max_x, b_max_y = _bounds_batch(b_xywh)
+    return (
+        (a_max_x > b_min_x)
+        & (a_min_x <= b_max_x)
+        & (a_max_y > b_min_y)
+        & (a_min_y <= b_max_y)
+    )
+
+
+# Structure-of-arrays store for many AABB2s. Each of x, y, width and height is
+# a contiguous row, so batch queries read whole rows instead of chasing one
+# Python object per box.
+class AABB2Array(_SoAArray):
+    __slots__ = ()
+
+    _components = 4
+    _item = AABB2
+    _tuple = AABB2Tuple
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._data[0, : self._len]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._data[1, : self._len]
+
+    @property
+    def width(self) -> np.ndarray:
+        return self._data[2, : self._len]
+
+    @property
+    def height(self) -> np.ndarray:
+        return self._data[3, : self._len]
+
+    def intersects(self, other: AABB2Like) -> np.ndarray:
+        return intersects_batch(self._rows().T, AABB2Tuple(other))
@@ -15,6 +15,9 @@ class Internal:
     frame_times_ns: np.ndarray = np.zeros(512, dtype=int)
     raw_frame_times_ns: np.ndarray = np.zeros(512, dtype=int)
 
+    frame_rate: int = 0
+    raw_frame_rate: int = 0
+
     engine_time_ns: int
     engine_frame_count: int
 
@@ -35,8 +38,8 @@ def start_frame() -> bool:
 
 
 def end_frame():
-    Internal.frame_times_ns[1:] = Internal.frame_times_ns[:-2]
-    Internal.raw_frame_times_ns[1:] = Internal.raw_frame_times_ns[:-2]
+    Internal.frame_times_ns[1:] = Internal.frame_times_ns[:-1]
+    Internal.raw_frame_times_ns[1:] = Internal.raw_frame_times_ns[:-1]
 
     smoothing = 1
 
@@ -47,6 +50,13 @@ def end_frame():
     )
     Internal.raw_frame_times_ns[0] = Internal.delta_frame_time_ns
 
+    frame_time_ns = int(Internal.frame_times_ns[0])
+    raw_frame_time_ns = Internal.delta_frame_time_ns
+    Internal.frame_rate = 1_000_000_000 // frame_time_ns if frame_time_ns > 0 else 0
+    Internal.raw_frame_rate = (
+        1_000_000_000 // raw_frame_time_ns if raw_frame_time_ns > 0 else 0
+    )
+
     Internal.engine_time_ns += Internal.delta_frame_time_ns
     Internal.engine_frame_count += 1
 
@@ -84,11 +94,11 @@ def get_frame_time() -> float:
 
 
 def get_raw_frame_rate() -> int:
-    return int(1_000_000_000 / get_raw_frame_time_ns())
+    return Internal.raw_frame_rate
 
 
 def get_frame_rate() -> int:
-    return int(1_000_000_000 / get_frame_time_ns())
+    return Internal.frame_rate
 
 
 def set_frame_rate(frame_rate: int):
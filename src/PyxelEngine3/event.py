@@ -1,54 +1,79 @@
+from __future__ import annotations
+
+import sys
 from abc import ABC
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
-from typing import ClassVar
+from typing import Callable
+
+# Events are compared by identity and are created at a high rate, so skip the
+# generated __eq__ and, where dataclasses support it (3.10+), the __dict__
+if sys.version_info >= (3, 10):
+    _event_dataclass = dataclass(frozen=True, repr=False, eq=False, slots=True)
+else:
+    _event_dataclass = dataclass(frozen=True, repr=False, eq=False)
+
+
+def _lazy_repr(self: Event) -> str:
+    return type(self)._build_repr()(self)
+
 
+# consume() is the only write to a frozen Event after construction
+_object_setattr = object.__setattr__
 
-@dataclass(frozen=True)
+
+@_event_dataclass
 class Event(ABC):
     time: float = field(metadata={"format": ".3f"})
+    _consumed: bool = field(default=False, init=False, repr=False)
 
-    _format_str: ClassVar[str]
+    __repr__ = _lazy_repr
 
     def __init_subclass__(cls, **kwargs):
-        vars = []
-        for f in fields(cls):
-            print_name = f.metadata.get("print_name", True)
-            format = f.metadata.get("format", "")
-            vars.append(
-                (f"{f.name}=" if print_name else "") + f"{{0.{f.name}:{format}}}"
-            )
-        cls._format_str = f"{cls.__name__}(" + ", ".join(vars) + ")"
-
-    def __repr__(self):
-        return self._format_str.format(self)
+        # The subclass fields only exist once @dataclass has processed the
+        # class, which happens after this hook, so __repr__ is generated lazily
+        cls.__repr__ = _lazy_repr
 
-    def __post_init__(self):
-        object.__setattr__(self, "_consumed", False)
+    @classmethod
+    def _build_repr(cls) -> Callable[[Event], str]:
+        parts = []
+        for f in fields(cls):
+            if not f.repr:
+                continue
+            label = f"{f.name}=" if f.metadata.get("print_name", True) else ""
+            spec = f.metadata.get("format", "")
+            parts.append(f"{label}{{self.{f.name}:{spec}}}")
+        template = f"{cls.__name__}({', '.join(parts)})"
+        namespace = {}
+        exec(f"def __repr__(self):\n    return f{template!r}\n", namespace)
+        function = namespace["__repr__"]
+        function.__qualname__ = f"{cls.__qualname__}.__repr__"
+        cls.__repr__ = function
+        return function
 
     @property
     def consumed(self) -> bool:
-        return object.__getattribute__(self, "_consumed")
+        return self._consumed
 
     def consume(self):
-        object.__setattr__(self, "_consumed", True)
+        _object_setattr(self, "_consumed", True)
 
 
 # ---------- [SECTION] Monitor Events ---------- #
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMonitor(Event, ABC):
     monitor: Monitor = field(metadata={"print_name": False})
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMonitorConnected(EventMonitor):
     pass
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMonitorDisconnected(EventMonitor):
     pass
 
@@ -56,17 +81,17 @@ class EventMonitorDisconnected(EventMonitor):
 # ---------- [SECTION] Mouse Events ---------- #
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouse(Event, ABC):
     window: _Window = field(metadata={"print_name": False})
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseEntered(EventMouse):
     entered: bool
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseMoved(EventMouse):
     pos: Vector2c
     rel: Vector2c
@@ -88,7 +113,7 @@ class EventMouseMoved(EventMouse):
         return self.rel.y
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseScrolled(EventMouse):
     scroll: Vector2c
 
@@ -101,7 +126,7 @@ class EventMouseScrolled(EventMouse):
         return self.scroll.y
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButton(EventMouse, ABC):
     button: Button = field(metadata={"print_name": False})
     pos: Vector2c
@@ -115,12 +140,12 @@ class EventMouseButton(EventMouse, ABC):
         return self.pos.y
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButtonDown(EventMouseButton):
     down_count: int
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButtonDragged(EventMouseButton):
     rel: Vector2c
     start: Vector2c
@@ -142,17 +167,17 @@ class EventMouseButtonDragged(EventMouseButton):
         return self.start.y
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButtonHeld(EventMouseButton):
     pass
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButtonRepeated(EventMouseButton):
     pass
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventMouseButtonUp(EventMouseButton):
     pass
 
@@ -160,12 +185,12 @@ class EventMouseButtonUp(EventMouseButton):
 # ---------- [SECTION] Keyboard Events ---------- #
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboard(Event, ABC):
     window: _Window = field(metadata={"print_name": False})
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardTyped(EventKeyboard):
     code_point: int
     typed: str = field(init=False)
@@ -174,26 +199,26 @@ class EventKeyboardTyped(EventKeyboard):
         object.__setattr__(self, "typed", chr(self.code_point))
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardKey(EventKeyboard, ABC):
     key: Key = field(metadata={"print_name": False})
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardKeyDown(EventKeyboardKey):
     down_count: int
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardKeyHeld(EventKeyboardKey):
     pass
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardKeyRepeated(EventKeyboardKey):
     pass
 
 
-@dataclass(frozen=True, repr=False)
+@_event_dataclass
 class EventKeyboardKeyUp(EventKeyboardKey):
     pass
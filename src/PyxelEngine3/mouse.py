@@ -5,6 +5,7 @@ from enum import unique
 from typing import Dict, Final, List, Tuple
 
 import glfw
+import numpy as np
 from PIL.Image import Image
 
 from PyxelEngine.delegator import run_task
@@ -21,19 +22,29 @@ class _Mouse:
         self._entered: bool = False
         self._enteredChanges: bool = False
 
-        self._pos: Final[Vector2] = Vector2(dtype=float)
-        self._posChanges: Final[Vector2] = Vector2(dtype=float)
+        # All positional state lives in one contiguous buffer, the vectors
+        # below are views into it
+        self._state: Final[np.ndarray] = np.zeros(10, dtype=float)
 
-        self._rel: Final[Vector2] = Vector2(dtype=float)
+        self._pos: Final[Vector2] = self._state[0:2].view(Vector2)
+        self._posChanges: Final[Vector2] = self._state[2:4].view(Vector2)
 
-        self._scroll: Final[Vector2] = Vector2(dtype=float)
-        self._scrollChanges: Final[Vector2] = Vector2(dtype=float)
+        self._rel: Final[Vector2] = self._state[4:6].view(Vector2)
+
+        self._scroll: Final[Vector2] = self._state[6:8].view(Vector2)
+        self._scrollChanges: Final[Vector2] = self._state[8:10].view(Vector2)
 
         self._buttonState: Final[Dict[Button, ButtonInput]] = {
             b: ButtonInput() for b in Button
         }
         self._buttonStateChanges: Final[List[Tuple[Button, int]]] = []
 
+        # GLFW reports buttons as ints, a dict lookup skips Enum's call path
+        self._buttonByCode: Final[Dict[int, Button]] = {b.value: b for b in Button}
+
+    def _get_button(self, code: int) -> Button:
+        return self._buttonByCode.get(code, Button.UNKNOWN)
+
     @property
     def visible(self) -> bool:
         return wait_task(
@@ -73,8 +84,32 @@ class Button(Enum):
     EIGHT = glfw.MOUSE_BUTTON_8
 
 
+_standard_shapes: Final[Dict[str, Tuple[str, int]]] = {
+    "ARROW_CURSOR": ("ARROW", glfw.ARROW_CURSOR),
+    "IBEAM_CURSOR": ("IBEAM", glfw.IBEAM_CURSOR),
+    "CROSSHAIR_CURSOR": ("CROSSHAIR", glfw.CROSSHAIR_CURSOR),
+    "HAND_CURSOR": ("HAND", glfw.HAND_CURSOR),
+    "HRESIZE_CURSOR": ("HRESIZE", glfw.HRESIZE_CURSOR),
+    "VRESIZE_CURSOR": ("VRESIZE", glfw.VRESIZE_CURSOR),
+}
+
+
+class _ShapeMeta(type):
+    def __getattr__(cls, name: str) -> Shape:
+        # Standard cursors are only created on first access, then stored on
+        # the class so later lookups never reach this method again
+        if name not in _standard_shapes:
+            raise AttributeError(name)
+        shape_name, shape_id = _standard_shapes[name]
+        shape = cls(
+            shape_name, wait_task(lambda: glfw.create_standard_cursor(shape_id))
+        )
+        setattr(cls, name, shape)
+        return shape
+
+
 # noinspection PyFinal
-class Shape:
+class Shape(metaclass=_ShapeMeta):
     ARROW_CURSOR: Final[Shape]
     IBEAM_CURSOR: Final[Shape]
     CROSSHAIR_CURSOR: Final[Shape]
@@ -95,29 +130,3 @@ class Shape:
 
     def destroy(self) -> None:
         run_task(lambda: glfw.destroy_cursor(self._handle))
-
-
-# noinspection PyFinal
-Shape.ARROW_CURSOR = Shape(
-    "ARROW", wait_task(lambda: glfw.create_standard_cursor(glfw.ARROW_CURSOR))
-)
-# noinspection PyFinal
-Shape.IBEAM_CURSOR = Shape(
-    "IBEAM", wait_task(lambda: glfw.create_standard_cursor(glfw.IBEAM_CURSOR))
-)
-# noinspection PyFinal
-Shape.CROSSHAIR_CURSOR = Shape(
-    "CROSSHAIR", wait_task(lambda: glfw.create_standard_cursor(glfw.CROSSHAIR_CURSOR))
-)
-# noinspection PyFinal
-Shape.HAND_CURSOR = Shape(
-    "HAND", wait_task(lambda: glfw.create_standard_cursor(glfw.HAND_CURSOR))
-)
-# noinspection PyFinal
-Shape.HRESIZE_CURSOR = Shape(
-    "HRESIZE", wait_task(lambda: glfw.create_standard_cursor(glfw.HRESIZE_CURSOR))
-)
-# noinspection PyFinal
-Shape.VRESIZE_CURSOR = Shape(
-    "VRESIZE", wait_task(lambda: glfw.create_standard_cursor(glfw.VRESIZE_CURSOR))
-)
@@ -1,10 +1,26 @@
-from typing import Dict, List
+import os
+import sys
+import threading
+from collections import deque
+from functools import lru_cache
+from functools import partial
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import glfw
-from OpenGL.raw.GL.VERSION.GL_1_0 import GL_COLOR_BUFFER_BIT
-from OpenGL.raw.GL.VERSION.GL_1_0 import glClear
+import OpenGL
 
-counter: int = 0
+# Must be set before any GL module is imported, the error checker is attached
+# to each function when it is created and would call glGetError on every call
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+
+from OpenGL.raw.GL.VERSION.GL_1_0 import GL_COLOR_BUFFER_BIT  # noqa: E402
+from OpenGL.raw.GL.VERSION.GL_1_0 import glClear  # noqa: E402
+
+# A list cell so callbacks can update it without a global statement
+counter: List[int] = [0]
+# Cleared by the close callback, so the main loop never has to poll windows
+running: List[bool] = [True]
 
 
 class Slot:
@@ -22,44 +38,91 @@ def usage() -> None:
     print("  -n the number of windows to create")
 
 
+# The glfw functions the event callbacks use, bound once at import
+_get_time = glfw.get_time
+_get_user_pointer = glfw.get_window_user_pointer
+_get_key_name = glfw.get_key_name
+_make_context_current = glfw.make_context_current
+_swap_buffers = glfw.swap_buffers
+_set_window_should_close = glfw.set_window_should_close
+_get_input_mode = glfw.get_input_mode
+_set_input_mode = glfw.set_input_mode
+
+# GLFW_EVENT_LOG=0 turns event logging off entirely, the callbacks that only log
+# are then never registered with GLFW
+_enabled: bool = os.environ.get("GLFW_EVENT_LOG", "1") != "0"
+
+# Callbacks only append (template, *values) records to a queue, a background
+# thread formats and writes them through one 64 KiB buffer whenever the main
+# loop finishes a batch of events, so no callback formats or blocks on stdout
+_out = open(sys.stdout.fileno(), "w", buffering=1 << 16, closefd=False)
+_log_records: Deque[Tuple[Callable[..., str], ...]] = deque()
+_log_lock = threading.Lock()
+_log_pending = threading.Event()
+_log = _log_records.append
+
+
+def _flush_log() -> None:
+    with _log_lock:
+        pop = _log_records.popleft
+        records = [pop() for _ in range(len(_log_records))]
+        if records:
+            _out.write("".join([record[0](*record[1:]) for record in records]))
+            _out.flush()
+
+
+def _log_writer() -> None:
+    while True:
+        _log_pending.wait()
+        _log_pending.clear()
+        _flush_log()
+
+
+# Templates for the log records, parsed once at import
+_fmt_message = "{}\n".format
+_fmt_error = "Error: {}\n".format
+_fmt_window_pos = "{:08X} to {} at {:0.3f}: Window position: {}, {}\n".format
+_fmt_window_size = "{:08X} to {} at {:0.3f}: Window size: {}, {}\n".format
+_fmt_framebuffer_size = "{:08X} to {} at {:0.3f}: Framebuffer size: {}, {}\n".format
+_fmt_content_scale = (
+    "{:08X} to {} at {:0.3f}: Window content scale: {:0.3f}, {:0.3f}\n".format
+)
+_fmt_window_close = "{:08X} to {} at {:0.3f}: Window close\n".format
+_fmt_close_disabled = "(( closing is disabled, press {} to re-enable )\n".format
+_fmt_window_refresh = "{:08X} to {} at {:0.3f}: Window refresh\n".format
+_fmt_window_focus = "{:08x} to {} at {:0.3f}: Window {}\n".format
+_fmt_window_iconify = "{:08x} to {} at {:0.3f}: Window was {}\n".format
+_fmt_window_maximize = "{:08x} to {} at {:0.3f}: Window was {}\n".format
+_fmt_mouse_button = (
+    "{:08x} to {} at {:0.3f}: Mouse button {} ({}) (with{}) was {}\n".format
+)
+_fmt_cursor_pos = "{:08x} to {} at {:0.3f}: Cursor position: {} {}\n".format
+_fmt_cursor_enter = "{:08x} to {} at {:0.3f}: Cursor {} window\n".format
+_fmt_scroll = "{:08x} to {} at {:0.3f}: Scroll: {:0.3f} {:0.3f}\n".format
+_fmt_key = (
+    "{:08x} to {} at {:0.3f}: Key 0x{:04x} Scancode 0x{:04x} ({}){} (with{}) was {}\n"
+).format
+_fmt_closing = "(( closing {} ))\n".format
+_fmt_lock_key_mods = "(( lock key mods {} ))\n".format
+_fmt_char = "{:08x} to {} at {:0.3f}: Character 0x{:08x} ({}) input\n".format
+_fmt_drop = "{:08x} to {} at {:0.3f}: Drop input\n".format
+_fmt_drop_path = '  {}: "{}"\n'.format
+_fmt_monitor_connected = (
+    "{:08x} at {:0.3f}: Monitor {} ({}x{} at {}x{}, {}x{} mm) was connected\n".format
+)
+_fmt_monitor_disconnected = "{:08x} at {:0.3f}: Monitor {} was disconnected\n".format
+_fmt_joystick_connected = (
+    "{:08x} at {:0.3f}: Joystick {} ({}) was connected"
+    " with {} axes, {} buttons, and {} hats\n"
+).format
+_fmt_joystick_gamepad = "  Joystick {} ({}) has a gamepad mapping ({})\n".format
+_fmt_joystick_no_gamepad = "  Joystick {} ({}) has no gamepad mapping\n".format
+_fmt_joystick_disconnected = "{:08x} at {:0.3f}: Joystick {} was disconnected\n".format
+
+
+# Letter and digit keys are named by their ASCII code and filled in below
 key_name: Dict[int, str] = {
     # Printable keys
-    glfw.KEY_A: "A",
-    glfw.KEY_B: "B",
-    glfw.KEY_C: "C",
-    glfw.KEY_D: "D",
-    glfw.KEY_E: "E",
-    glfw.KEY_F: "F",
-    glfw.KEY_G: "G",
-    glfw.KEY_H: "H",
-    glfw.KEY_I: "I",
-    glfw.KEY_J: "J",
-    glfw.KEY_K: "K",
-    glfw.KEY_L: "L",
-    glfw.KEY_M: "M",
-    glfw.KEY_N: "N",
-    glfw.KEY_O: "O",
-    glfw.KEY_P: "P",
-    glfw.KEY_Q: "Q",
-    glfw.KEY_R: "R",
-    glfw.KEY_S: "S",
-    glfw.KEY_T: "T",
-    glfw.KEY_U: "U",
-    glfw.KEY_V: "V",
-    glfw.KEY_W: "W",
-    glfw.KEY_X: "X",
-    glfw.KEY_Y: "Y",
-    glfw.KEY_Z: "Z",
-    glfw.KEY_1: "1",
-    glfw.KEY_2: "2",
-    glfw.KEY_3: "3",
-    glfw.KEY_4: "4",
-    glfw.KEY_5: "5",
-    glfw.KEY_6: "6",
-    glfw.KEY_7: "7",
-    glfw.KEY_8: "8",
-    glfw.KEY_9: "9",
-    glfw.KEY_0: "0",
     glfw.KEY_SPACE: "SPACE",
     glfw.KEY_MINUS: "MINUS",
     glfw.KEY_EQUAL: "EQUAL",
@@ -147,6 +210,13 @@ key_name: Dict[int, str] = {
     glfw.KEY_MENU: "MENU",
 }
 
+# Key codes are small and dense, so index a flat table instead of hashing
+_key_names: List[str] = ["UNKNOWN"] * (glfw.KEY_LAST + 1)
+for _key in (*range(glfw.KEY_0, glfw.KEY_9 + 1), *range(glfw.KEY_A, glfw.KEY_Z + 1)):
+    _key_names[_key] = chr(_key)
+for _key, _name in key_name.items():
+    _key_names[_key] = _name
+
 action_name: Dict[int, str] = {
     glfw.PRESS: "pressed",
     glfw.RELEASE: "released",
@@ -160,28 +230,35 @@ button_name: Dict[int, str] = {
 }
 
 
+# Actions and mouse buttons are small integers too, unnamed buttons keep their
+# number as the name
+_action_names: Tuple[str, ...] = tuple(
+    action_name.get(action, "caused unknown action")
+    for action in range(max(action_name) + 1)
+)
+_button_names: Tuple[str, ...] = tuple(
+    sys.intern(button_name.get(button, str(button)))
+    for button in range(glfw.MOUSE_BUTTON_LAST + 1)
+)
+
+
 def get_key_name(key: int) -> str:
-    try:
-        return key_name[key]
-    except KeyError:
-        return "UNKNOWN"
+    return _key_names[key] if 0 <= key <= glfw.KEY_LAST else "UNKNOWN"
 
 
 def get_action_name(action: int) -> str:
-    try:
-        return action_name[action]
-    except KeyError:
-        return "caused unknown action"
+    if 0 <= action < len(_action_names):
+        return _action_names[action]
+    return "caused unknown action"
 
 
 def get_button_name(button: int) -> str:
-    try:
-        return button_name[button]
-    except KeyError:
-        return str(button)
+    if 0 <= button < len(_button_names):
+        return _button_names[button]
+    return str(button)
 
 
-def get_mods_name(mods: int) -> str:
+def _build_mods_name(mods: int) -> str:
     if mods == 0:
         return " no mods"
 
@@ -203,219 +280,210 @@ def get_mods_name(mods: int) -> str:
     return name
 
 
-def error_callback(error: int, description: str) -> None:
-    print(f"Error: {description}")
-
+# The six modifier bits only have 64 combinations, so every name is built and
+# interned once, like the literal names in the other tables
+mods_name: Tuple[str, ...] = tuple(
+    sys.intern(_build_mods_name(mods)) for mods in range(0x40)
+)
 
-def window_pos_callback(window: int, x: int, y: int) -> None:
-    global counter
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Window position: {x}, {y}"
-    )
+def get_mods_name(mods: int) -> str:
+    return mods_name[mods & 0x3F]
 
-    counter += 1
 
+# Resolve names and flags on the writer thread, so the callbacks only queue the
+# raw GLFW values
+def _format_window_focus(index: int, number: int, time: float, focused: int) -> str:
+    return _fmt_window_focus(index, number, time, "focused" if focused else "unfocused")
 
-def window_size_callback(window: int, width: int, height: int) -> None:
-    global counter
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Window size: {width}, {height}"
+def _format_window_iconify(index: int, number: int, time: float, iconified: int) -> str:
+    return _fmt_window_iconify(
+        index, number, time, "iconified" if iconified else "uniconified"
     )
 
-    counter += 1
-
 
-def framebuffer_size_callback(window: int, width: int, height: int) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Framebuffer size: {width}, {height}"
+def _format_window_maximize(
+    index: int, number: int, time: float, maximized: int
+) -> str:
+    return _fmt_window_maximize(
+        index, number, time, "maximized" if maximized else "unmaximized"
     )
 
-    counter += 1
-
 
-def window_content_scale_callback(window: int, xscale: float, yscale: float) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Window content scale: {xscale:0.3f}, {yscale:0.3f}"
+def _format_mouse_button(
+    index: int, number: int, time: float, button: int, action: int, mods: int
+) -> str:
+    return _fmt_mouse_button(
+        index,
+        number,
+        time,
+        button,
+        get_button_name(button),
+        get_mods_name(mods),
+        get_action_name(action),
     )
 
-    counter += 1
-
-
-def window_close_callback(window: int) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    print(f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Window close")
 
-    counter += 1
-
-    if not slot.closable:
-        print(
-            f"(( closing is disabled, press {glfw.get_key_name(glfw.KEY_C, 0)} to re-enable )"
-        )
-
-    glfw.set_window_should_close(window, slot.closable)
-
-
-def window_refresh_callback(window: int) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    print(f"{counter:08X} to {slot.number} at {glfw.get_time():0.3f}: Window refresh")
-
-    counter += 1
-
-    glfw.make_context_current(window)
-    glClear(GL_COLOR_BUFFER_BIT)
-    glfw.swap_buffers(window)
-
-
-def window_focus_callback(window: int, focused: bool) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Window {'focused' if focused else 'unfocused'}"
+def _format_cursor_enter(index: int, number: int, time: float, entered: int) -> str:
+    return _fmt_cursor_enter(index, number, time, "entered" if entered else "left")
+
+
+def _format_key(
+    index: int,
+    number: int,
+    time: float,
+    key: int,
+    scancode: int,
+    key_label: str,
+    action: int,
+    mods: int,
+) -> str:
+    return _fmt_key(
+        index,
+        number,
+        time,
+        key,
+        scancode,
+        get_key_name(key),
+        key_label,
+        get_mods_name(mods),
+        get_action_name(action),
     )
 
-    counter += 1
 
+def _format_char(index: int, number: int, time: float, codepoint: int) -> str:
+    return _fmt_char(index, number, time, codepoint, chr(codepoint))
 
-def window_iconify_callback(window: int, iconified: bool) -> None:
-    global counter
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Window was {'iconified' if iconified else 'uniconified'}"
+def _format_drop(index: int, number: int, time: float, paths: List[str]) -> str:
+    return _fmt_drop(index, number, time) + "".join(
+        [_fmt_drop_path(i, path) for i, path in enumerate(paths)]
     )
 
-    counter += 1
 
+def logged(
+    template: Callable[..., str], callback: Optional[Callable[..., None]] = None
+) -> Optional[Callable[..., None]]:
+    # Builds a window callback that logs template with the event counter, slot
+    # number, time and GLFW's arguments, then runs callback(window, slot, *args)
+    if not _enabled:
+        if callback is None:
+            return None
 
-def window_maximize_callback(window: int, maximized: bool) -> None:
-    global counter
+        def logged_callback(window: int, *args) -> None:
+            callback(window, _get_user_pointer(window), *args)
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Window was {'maximized' if maximized else 'unmaximized'}"
-    )
+    elif callback is None:
 
-    counter += 1
+        def logged_callback(window: int, *args) -> None:
+            index = counter[0]
+            _log(
+                (template, index, _get_user_pointer(window).number, _get_time(), *args)
+            )
+            counter[0] = index + 1
 
+    else:
 
-def mouse_button_callback(window: int, button: int, action: int, mods: int) -> None:
-    global counter
+        def logged_callback(window: int, *args) -> None:
+            index = counter[0]
+            slot = _get_user_pointer(window)
+            _log((template, index, slot.number, _get_time(), *args))
+            counter[0] = index + 1
+            callback(window, slot, *args)
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Mouse button {button} ({get_button_name(button)}) (with{get_mods_name(mods)}) was {get_action_name(action)}"
-    )
+    return logged_callback
 
-    counter += 1
 
+def error_callback(error: int, description: str) -> None:
+    _log((_fmt_error, description))
 
-def cursor_position_callback(window: int, x: float, y: float) -> None:
-    global counter
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Cursor position: {x} {y}"
-    )
+window_pos_callback = logged(_fmt_window_pos)
+window_size_callback = logged(_fmt_window_size)
+framebuffer_size_callback = logged(_fmt_framebuffer_size)
+window_content_scale_callback = logged(_fmt_content_scale)
 
-    counter += 1
 
+@partial(logged, _fmt_window_close)
+def window_close_callback(window: int, slot: Slot) -> None:
+    if not slot.closable:
+        _log((_fmt_close_disabled, _get_key_name(glfw.KEY_C, 0)))
 
-def cursor_enter_callback(window: int, entered: bool) -> None:
-    global counter
+    _set_window_should_close(window, slot.closable)
+    if slot.closable:
+        running[0] = False
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Cursor {'entered' if entered else 'left'} window"
-    )
 
-    counter += 1
+@partial(logged, _fmt_window_refresh)
+def window_refresh_callback(window: int, slot: Slot) -> None:
+    _make_context_current(window)
+    glClear(GL_COLOR_BUFFER_BIT)
+    _swap_buffers(window)
 
 
-def scroll_callback(window: int, x: float, y: float) -> None:
-    global counter
+window_focus_callback = logged(_format_window_focus)
+window_iconify_callback = logged(_format_window_iconify)
+window_maximize_callback = logged(_format_window_maximize)
+mouse_button_callback = logged(_format_mouse_button)
+cursor_position_callback = logged(_fmt_cursor_pos)
+cursor_enter_callback = logged(_format_cursor_enter)
+scroll_callback = logged(_fmt_scroll)
 
-    slot = glfw.get_window_user_pointer(window)
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Scroll: {x:0.3f} {y:0.3f}"
-    )
 
-    counter += 1
+# Each (key, scancode) pair is only asked for once, this goes stale if the
+# keyboard layout changes while the example is running
+@lru_cache(maxsize=None)
+def _get_key_label(key: int, scancode: int) -> str:
+    name = _get_key_name(key, scancode)
+    return f" ({name})" if name else ""
 
 
 def key_callback(window: int, key: int, scancode: int, action: int, mods: int) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    name = glfw.get_key_name(key, scancode)
-
-    if name:
-        print(
-            f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Key 0x{key:04x} Scancode 0x{scancode:04x} ({get_key_name(key)}) ({name}) (with{get_mods_name(mods)}) was {get_action_name(action)}"
-        )
-    else:
-        print(
-            f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Key 0x{key:04x} Scancode 0x{scancode:04x} ({get_key_name(key)}) (with{get_mods_name(mods)}) was {get_action_name(action)}"
+    slot = _get_user_pointer(window)
+
+    if _enabled:
+        index = counter[0]
+        _log(
+            (
+                _format_key,
+                index,
+                slot.number,
+                _get_time(),
+                key,
+                scancode,
+                _get_key_label(key, scancode),
+                action,
+                mods,
+            )
         )
-
-    counter += 1
+        counter[0] = index + 1
 
     if action != glfw.PRESS:
         return
 
-    if action == glfw.KEY_C:
+    if key == glfw.KEY_C:
         slot.closable = not slot.closable
 
-        print(f"(( closing {'enabled' if slot.closable else 'disabled'} ))")
-    elif action == glfw.KEY_L:
-        state = glfw.get_input_mode(window, glfw.LOCK_KEY_MODS)
-        glfw.set_input_mode(window, glfw.LOCK_KEY_MODS, not state)
-
-        print(f"(( lock key mods {'enabled' if not state else 'disabled'} ))")
-
-
-def char_callback(window: int, codepoint: int) -> None:
-    global counter
-
-    slot = glfw.get_window_user_pointer(window)
-    string = chr(codepoint)
-
-    print(
-        f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Character 0x{codepoint:08x} ({string}) input"
-    )
-
-    counter += 1
-
+        _log((_fmt_closing, "enabled" if slot.closable else "disabled"))
+    elif key == glfw.KEY_L:
+        state = _get_input_mode(window, glfw.LOCK_KEY_MODS)
+        _set_input_mode(window, glfw.LOCK_KEY_MODS, not state)
 
-def drop_callback(window: int, paths: List[str]) -> None:
-    global counter
+        _log((_fmt_lock_key_mods, "enabled" if not state else "disabled"))
 
-    slot = glfw.get_window_user_pointer(window)
 
-    print(f"{counter:08x} to {slot.number} at {glfw.get_time():0.3f}: Drop input")
+char_callback = logged(_format_char)
 
-    for i, path in enumerate(paths):
-        print(f'  {i}: "{path}"')
 
-    counter += 1
+drop_callback = logged(_format_drop)
 
 
 def monitor_callback(monitor: int, event: int) -> None:
-    global counter
+    if not _enabled:
+        return
+
+    index = counter[0]
 
     if event == glfw.CONNECTED:
         mode = glfw.get_video_mode(monitor)
@@ -423,54 +491,86 @@ def monitor_callback(monitor: int, event: int) -> None:
         x, y = glfw.get_monitor_pos(monitor)
         widthMM, heightMM = glfw.get_monitor_physical_size(monitor)
 
-        print(
-            f"{counter:08x} at {glfw.get_time():0.3f}: Monitor {glfw.get_monitor_name(monitor)} ({mode.width}x{mode.height} at {x}x{y}, {widthMM}x{heightMM} mm) was connected"
+        _log(
+            (
+                _fmt_monitor_connected,
+                index,
+                _get_time(),
+                glfw.get_monitor_name(monitor),
+                mode.width,
+                mode.height,
+                x,
+                y,
+                widthMM,
+                heightMM,
+            )
         )
 
-        counter += 1
+        counter[0] = index + 1
     elif event == glfw.DISCONNECTED:
-        print(
-            f"{counter:08x} at {glfw.get_time():0.3f}: Monitor {glfw.get_monitor_name(monitor)} was disconnected"
+        _log(
+            (
+                _fmt_monitor_disconnected,
+                index,
+                _get_time(),
+                glfw.get_monitor_name(monitor),
+            )
         )
 
-        counter += 1
+        counter[0] = index + 1
 
 
 def joystick_callback(jid: int, event: int) -> None:
-    global counter
+    if not _enabled:
+        return
+
+    index = counter[0]
 
     if event == glfw.CONNECTED:
         axisCount = glfw.get_joystick_axes(jid)
         buttonCount = glfw.get_joystick_buttons(jid)
         hatCount = glfw.get_joystick_hats(jid)
 
-        print(
-            f"{counter:08x} at {glfw.get_time():0.3f}: Joystick {jid} ({glfw.get_joystick_name(jid)}) was connected with {axisCount} axes, {buttonCount} buttons, and {hatCount} hats"
+        _log(
+            (
+                _fmt_joystick_connected,
+                index,
+                _get_time(),
+                jid,
+                glfw.get_joystick_name(jid),
+                axisCount,
+                buttonCount,
+                hatCount,
+            )
         )
 
         if glfw.joystick_is_gamepad(jid):
-            print(
-                f"  Joystick {jid} ({glfw.get_joystick_guid(jid)}) has a gamepad mapping ({glfw.get_gamepad_name(jid)})"
+            _log(
+                (
+                    _fmt_joystick_gamepad,
+                    jid,
+                    glfw.get_joystick_guid(jid),
+                    glfw.get_gamepad_name(jid),
+                )
             )
         else:
-            print(
-                f"  Joystick {jid} ({glfw.get_joystick_guid(jid)}) has no gamepad mapping"
-            )
+            _log((_fmt_joystick_no_gamepad, jid, glfw.get_joystick_guid(jid)))
     else:
-        print(
-            f"{counter:08x} at {glfw.get_time():0.3f}: Joystick {jid} was disconnected"
-        )
+        _log((_fmt_joystick_disconnected, index, _get_time(), jid))
 
-    counter += 1
+    counter[0] = index + 1
 
 
 def main():
+    threading.Thread(target=_log_writer, name="EventLog", daemon=True).start()
+
     glfw.set_error_callback(error_callback)
 
     if not glfw.init():
+        _flush_log()
         exit(-1)
 
-    print("Library initialized")
+    _log((_fmt_message, "Library initialized"))
 
     glfw.set_monitor_callback(monitor_callback)
     glfw.set_joystick_callback(joystick_callback)
@@ -521,15 +621,24 @@ def main():
         title: str = f"Event Linter (Window {slot.number})"
 
         if monitor is not None:
-            print(
-                f"Creating full screen window {slot.number} ({width}x{height} on {glfw.get_monitor_name(monitor)})"
+            _log(
+                (
+                    _fmt_message,
+                    f"Creating full screen window {slot.number} ({width}x{height} on {glfw.get_monitor_name(monitor)})",
+                )
             )
         else:
-            print(f"Creating windowed mode window {slot.number} ({width}x{height})")
+            _log(
+                (
+                    _fmt_message,
+                    f"Creating windowed mode window {slot.number} ({width}x{height})",
+                )
+            )
 
         slot.window = glfw.create_window(width, height, title, monitor, None)
         if not slot.window:
             glfw.terminate()
+            _flush_log()
             exit(-1)
 
         glfw.set_window_user_pointer(slot.window, slot)
@@ -559,25 +668,19 @@ def main():
 
         slots.append(slot)
 
-    print("Main loop starting")
-
-    while True:
-        index = 0
-        for i, slot in enumerate(slots):
-            index = i + 1
-            if glfw.window_should_close(slot.window):
-                break
-
-        if index < count:
-            break
+    _log((_fmt_message, "Main loop starting"))
 
-        glfw.wait_events()
+    while running[0]:
+        # Wake at least once a frame so buffered output never sits unflushed
+        # for longer than that
+        glfw.wait_events_timeout(1 / 60)
 
         # Workaround for an issue with msvcrt and mintty
-        # fflush(stdout)
+        _log_pending.set()
 
     # free(slots)
     glfw.terminate()
+    _flush_log()
     exit(0)
 
 
@@ -0,0 +1,9 @@
+from typing import Sequence
+
+from PyxelEngine.math import Vector2
+
+
+# Checks components by value so assertions do not go through Vector2.__eq__
+def v_eq(v: Vector2, expected: Sequence) -> None:
+    x, y = v.tolist()
+    assert x == expected[0] and y == expected[1], f"{v} != {tuple(expected)}"
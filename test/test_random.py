@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import numpy as np
+import pytest
+
+from PyxelEngine.math import Vector2
+from PyxelEngine.math import Vector3
+from PyxelEngine.math import Vector4
+from PyxelEngine.random import Random
+
+
+class TestRandom(unittest.TestCase):
+    def test_seed(self):
+        a: Random = Random(1024)
+        b: Random = Random(1024)
+        self.assertEqual(a.random(), b.random())
+        self.assertEqual(a.randvec3().tolist(), b.randvec3().tolist())
+        self.assertEqual(a.randvec_batch(8, 2).tolist(), b.randvec_batch(8, 2).tolist())
+
+        # Seeding the NumPy generator does not shift the scalar stream
+        self.assertEqual(Random(7).random(), random.Random(7).random())
+
+    def test_state(self):
+        rng: Random = Random(1024)
+        rng.randvec_batch(4, 3)
+        state = rng.getstate()
+        scalar = rng.random()
+        batch = rng.randvec_batch(4, 3)
+
+        rng.setstate(state)
+        self.assertEqual(rng.random(), scalar)
+        self.assertEqual(rng.randvec_batch(4, 3).tolist(), batch.tolist())
+
+        # A plain random.Random state restores the NumPy generator as seed() would
+        rng.setstate(random.Random(5).getstate())
+        self.assertEqual(
+            rng.randvec_batch(4, 3).tolist(), Random(5).randvec_batch(4, 3).tolist()
+        )
+
+    def test_randvec(self):
+        rng: Random = Random(1024)
+        for method, cls in (
+            (rng.randvec2, Vector2),
+            (rng.randvec3, Vector3),
+            (rng.randvec4, Vector4),
+        ):
+            v = method()
+            self.assertIsInstance(v, cls)
+            self.assertAlmostEqual(v.magnitude, 1.0)
+
+            out = cls(dtype=float)
+            self.assertIs(method(out), out)
+            self.assertAlmostEqual(out.magnitude, 1.0)
+
+    def test_randvec_distribution(self):
+        # Directions are uniform, so a large sample averages out near zero
+        rng: Random = Random(1024)
+        for method in (rng.randvec2, rng.randvec3, rng.randvec4):
+            mean = np.mean([method() for _ in range(4000)], axis=0)
+            self.assertLess(np.abs(mean).max(), 0.05)
+
+
+@pytest.mark.parametrize("dim", [2, 3, 4])
+def test_randvec_batch(dim):
+    rng: Random = Random(1024)
+    batch = rng.randvec_batch(256, dim)
+    assert batch.shape == (256, dim)
+    np.testing.assert_allclose(np.linalg.norm(batch, axis=1), 1.0)
+
+    out = np.empty((256, dim), dtype=np.float32)
+    assert rng.randvec_batch(256, dim, out=out) is out
+    np.testing.assert_allclose(np.linalg.norm(out, axis=1), 1.0, rtol=1e-6)
+
+
+def test_randvec_batch_invalid_out():
+    rng: Random = Random(1024)
+    with pytest.raises(ValueError):
+        rng.randvec_batch(8, 3, out=np.empty((8, 2)))
+    with pytest.raises(TypeError):
+        rng.randvec_batch(8, 3, out=np.empty((8, 3), dtype=int))
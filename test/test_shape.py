@@ -1,122 +1,26 @@
 import unittest
 
 import numpy as np
+import pytest
 
 from PyxelEngine.math import Vector2
 from PyxelEngine.math import Vector4Tuple
-from PyxelEngine.shape import AABB2, AABB3
+from PyxelEngine.shape import AABB2
+from PyxelEngine.shape import AABB3
+from PyxelEngine.shape import AABB2Array
 from PyxelEngine.shape import AABB2Tuple
 from PyxelEngine.shape import AABB3Tuple
+from PyxelEngine.shape import intersects_batch
 
+# Shared read-only inputs so the tests do not rebuild them on every call
+_NP_1234 = np.array([1, 2, 3, 4], dtype=np.float64)
+_NP_1234.setflags(write=False)
+_NP_12_34 = _NP_1234.reshape(2, 2)
+_NP_123456 = np.array([1, 2, 3, 4, 5, 6], dtype=np.float64)
+_NP_123456.setflags(write=False)
 
-class TestAABB2(unittest.TestCase):
-    # noinspection PyArgumentList
-    def test_to_tuple(self):
-        (x, y), (w, h) = AABB2Tuple()
-        self.assertEqual(x, 0)
-        self.assertEqual(y, 0)
-        self.assertEqual(w, 1)
-        self.assertEqual(h, 1)
-
-        (x, y), (w, h) = AABB2Tuple(AABB2((1, 2), (3, 4)))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        (x, y), (w, h) = AABB2Tuple(tuple())
-        self.assertEqual(x, 0)
-        self.assertEqual(y, 0)
-        self.assertEqual(w, 1)
-        self.assertEqual(h, 1)
-
-        self.assertRaises(TypeError, lambda: AABB2Tuple((1,)))
-        self.assertRaises(TypeError, lambda: AABB2Tuple((1, 2)))
-        self.assertRaises(TypeError, lambda: AABB2Tuple((1, 2, 3)))
-
-        (x, y), (w, h) = AABB2Tuple((1, 2, 3, 4))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        (x, y), (w, h) = AABB2Tuple(Vector4Tuple(1, 2, 3, 4))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        (x, y), (w, h) = AABB2Tuple(np.array([1, 2, 3, 4]))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        self.assertRaises(TypeError, lambda: AABB2Tuple((1, 2, 3, 4, 5)))
-
-        (x, y), (w, h) = AABB2Tuple(((1, 2), (3, 4)))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        (x, y), (w, h) = AABB2Tuple(((1,), (2, 3)))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 1)
-        self.assertEqual(w, 2)
-        self.assertEqual(h, 3)
-
-        (x, y), (w, h) = AABB2Tuple(((1, 2), (3,)))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 3)
-
-        (x, y), (w, h) = AABB2Tuple(((1,), (2,)))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 1)
-        self.assertEqual(w, 2)
-        self.assertEqual(h, 2)
-
-        self.assertRaises(TypeError, lambda: AABB2Tuple(((1, 2, 3), (4, 5))))
-        self.assertRaises(TypeError, lambda: AABB2Tuple(((1, 2), (3, 4, 5))))
-        self.assertRaises(TypeError, lambda: AABB2Tuple(((1,), (2,), (3,))))
-
-        (x, y), (w, h) = AABB2Tuple((1, 2), (3, 4))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        (x, y), (w, h) = AABB2Tuple((1,), (2, 3))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 1)
-        self.assertEqual(w, 2)
-        self.assertEqual(h, 3)
-
-        (x, y), (w, h) = AABB2Tuple((1, 2), (3,))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 3)
-
-        (x, y), (w, h) = AABB2Tuple((1,), (2,))
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 1)
-        self.assertEqual(w, 2)
-        self.assertEqual(h, 2)
-
-        self.assertRaises(TypeError, lambda: AABB2Tuple(1, 2, 3))
-        self.assertRaises(TypeError, lambda: AABB2Tuple((1,), (2,), (3,)))
-
-        (x, y), (w, h) = AABB2Tuple(1, 2, 3, 4)
-        self.assertEqual(x, 1)
-        self.assertEqual(y, 2)
-        self.assertEqual(w, 3)
-        self.assertEqual(h, 4)
-
-        self.assertRaises(TypeError, lambda: AABB2Tuple(1, 2, 3, 4, 5))
 
+class TestAABB2(unittest.TestCase):
     def test_init(self):
         aabb: AABB2 = AABB2()
 
@@ -146,6 +50,13 @@ class TestAABB2(unittest.TestCase):
         self.assertEqual(aabb.width, 15.0, "AABB2.width must be 15.0")
         self.assertEqual(aabb.height, 15.0, "AABB2.height must be 15.0")
 
+        aabb2: AABB2 = AABB2(aabb, dtype=int)
+        aabb2.pos.x = 99
+        aabb2.size.y = 99
+        self.assertEqual(aabb2.pos.dtype, int)
+        self.assertEqual(aabb.x, 1.0, "AABB2 copy must not share pos")
+        self.assertEqual(aabb.height, 15.0, "AABB2 copy must not share size")
+
     def test_type_change(self):
         aabb: AABB2 = AABB2((1.125, 6.095), (4.563, 9.798))
 
@@ -156,6 +67,11 @@ class TestAABB2(unittest.TestCase):
         self.assertEqual(aabb2.width, 4, "AABB2.width must be 4")
         self.assertEqual(aabb2.height, 9, "AABB2.height must be 9")
 
+        aabb2: AABB2 = aabb.astype(dtype=np.float32)
+        self.assertEqual(aabb2.pos.dtype, np.float32)
+        self.assertEqual(aabb2.size.dtype, np.float32)
+        self.assertTrue(aabb2.intersects(aabb))
+
         aabb2: AABB2 = aabb.astype(dtype=int, copy=False)
         self.assertIs(aabb2, aabb)
         self.assertEqual(aabb2.x, 1, "AABB2.x must be 1")
@@ -163,6 +79,12 @@ class TestAABB2(unittest.TestCase):
         self.assertEqual(aabb2.width, 4, "AABB2.width must be 4")
         self.assertEqual(aabb2.height, 9, "AABB2.height must be 9")
 
+        pos_data = aabb.pos.__array_interface__["data"][0]
+        aabb2: AABB2 = aabb.astype(dtype=int, copy=False)
+        self.assertIs(aabb2, aabb)
+        self.assertEqual(aabb2.pos.__array_interface__["data"][0], pos_data)
+        self.assertEqual(aabb2.x, 1, "AABB2.x must be 1")
+
     def test_intersects(self):
         aabb: AABB2 = AABB2((1.125, 1.125), (4.625, 4.625))
 
@@ -191,12 +113,198 @@ class TestAABB2(unittest.TestCase):
         self.assertTrue(aabb.intersects((4.9, 4.9, 4, 4)))
         self.assertFalse(aabb.intersects((5.0, 5.0, 4, 4)))
 
+    def test_mutate_in_place(self):
+        aabb: AABB2 = AABB2(0, 0, 1, 1)
+        aabb.pos.x = 5
+        self.assertEqual(aabb.min_x, 5.0)
+        self.assertTrue(aabb.intersects(AABB2(5, 0, 1, 1)))
+        self.assertTrue(aabb.test_point((5.5, 0.5)))
+
+        aabb.size[:] = 10
+        self.assertEqual(aabb.max_x, 15.0)
+        self.assertEqual(aabb.max_y, 10.0)
+        self.assertTrue(aabb.contains((6, 6, 2, 2)))
+
+        aabb.size.x = -10
+        self.assertEqual(aabb.min_x, -5.0)
+        self.assertEqual(aabb.max_x, 5.0)
+        self.assertTrue(aabb.intersects_segment((-4, 1), (-4, 2)))
+
+        pos: Vector2 = Vector2(20, 20)
+        aabb.pos = pos
+        pos += 1
+        self.assertEqual(aabb.max_x, 21.0)
+        self.assertEqual(aabb.min_y, 21.0)
+
+    def test_intersects_batch(self):
+        rng = np.random.default_rng(1024)
+        a = rng.integers(-8, 8, size=(1024, 4)).astype(float)
+        b = rng.integers(-8, 8, size=(1024, 4)).astype(float)
+
+        result = intersects_batch(a, b)
+        self.assertEqual(result.shape, (1024,))
+        expected = [AABB2(*ai).intersects(bi) for ai, bi in zip(a.tolist(), b.tolist())]
+        self.assertEqual(result.tolist(), expected)
+
+        pairs = intersects_batch(a[:16, None], b[None, :16])
+        self.assertEqual(pairs.shape, (16, 16))
+        self.assertEqual(pairs[3, 7], AABB2(*a[3]).intersects(b[7]))
+
+    def test_test_points(self):
+        aabb: AABB2 = AABB2((1, 1), (4, 4))
+
+        points = np.array([[1, 1], [4.9, 4.9], [5, 5], [0.9, 2], [3, 5]])
+        result = aabb.test_points(points)
+        self.assertEqual(result.shape, (5,))
+        self.assertEqual(result.tolist(), [aabb.test_point(p) for p in points.tolist()])
+        self.assertEqual(result.tolist(), [True, True, False, False, False])
+
+        aabb: AABB2 = AABB2((5, 5), (-4, -4))
+        self.assertEqual(aabb.test_points(points).tolist(), result.tolist())
+
+    def test_intersects_segment(self):
+        aabb: AABB2 = AABB2((1, 1), (4, 4))
+
+        # Entering, exiting and passing through
+        self.assertTrue(aabb.intersects_segment((0, 0), (2, 2)))
+        self.assertTrue(aabb.intersects_segment((3, 3), (7, 3)))
+        self.assertTrue(aabb.intersects_segment((0, 3), (6, 3)))
+        # Starting inside, touching an edge, stopping short
+        self.assertTrue(aabb.intersects_segment((2, 2), (3, 3)))
+        self.assertTrue(aabb.intersects_segment((5, 0), (5, 2)))
+        self.assertFalse(aabb.intersects_segment((-3, 3), (0, 3)))
+        # Parallel misses and a diagonal miss past the corner
+        self.assertFalse(aabb.intersects_segment((0, 0), (0, 6)))
+        self.assertFalse(aabb.intersects_segment((0, 6), (6, 6)))
+        self.assertFalse(aabb.intersects_segment((0, 4), (2, 7)))
+
+        aabb: AABB2 = AABB2((5, 5), (-4, -4))
+        self.assertTrue(aabb.intersects_segment((0, 0), (2, 2)))
+
+    def test_intersects_segments(self):
+        aabb: AABB2 = AABB2((1, 1), (4, 4))
+
+        rng = np.random.default_rng(71)
+        start = rng.integers(-2, 8, size=(512, 2)).astype(float)
+        end = rng.integers(-2, 8, size=(512, 2)).astype(float)
+
+        result = aabb.intersects_segments(start, end)
+        self.assertEqual(result.shape, (512,))
+        expected = [
+            aabb.intersects_segment(s, e) for s, e in zip(start.tolist(), end.tolist())
+        ]
+        self.assertEqual(result.tolist(), expected)
+
+
+# noinspection PyArgumentList
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        ((), (0, 0, 1, 1)),
+        ((AABB2((1, 2), (3, 4)),), (1, 2, 3, 4)),
+        ((tuple(),), (0, 0, 1, 1)),
+        (((1, 2, 3, 4),), (1, 2, 3, 4)),
+        ((Vector4Tuple(1, 2, 3, 4),), (1, 2, 3, 4)),
+        ((_NP_1234,), (1, 2, 3, 4)),
+        ((_NP_12_34,), (1, 2, 3, 4)),
+        ((((1, 2), (3, 4)),), (1, 2, 3, 4)),
+        ((((1,), (2, 3)),), (1, 1, 2, 3)),
+        ((((1, 2), (3,)),), (1, 2, 3, 3)),
+        ((((1,), (2,)),), (1, 1, 2, 2)),
+        (((1, 2), (3, 4)), (1, 2, 3, 4)),
+        (((1,), (2, 3)), (1, 1, 2, 3)),
+        (((1, 2), (3,)), (1, 2, 3, 3)),
+        (((1,), (2,)), (1, 1, 2, 2)),
+        ((1, 2, 3, 4), (1, 2, 3, 4)),
+    ],
+)
+def test_aabb2_to_tuple(args, expected):
+    assert AABB2Tuple(*args) == expected
+
+
+# noinspection PyArgumentList
+@pytest.mark.parametrize(
+    "args",
+    [
+        ((1,),),
+        ((1, 2),),
+        ((1, 2, 3),),
+        ((1, 2, 3, 4, 5),),
+        (((1, 2, 3), (4, 5)),),
+        (((1, 2), (3, 4, 5)),),
+        (((1,), (2,), (3,)),),
+        (1, 2, 3),
+        ((1,), (2,), (3,)),
+        (1, 2, 3, 4, 5),
+    ],
+)
+def test_aabb2_to_tuple_invalid(args):
+    with pytest.raises(TypeError):
+        AABB2Tuple(*args)
+
+
+def test_aabb2_tuple_repeated_signatures():
+    # Parsing the same flat argument types again gives the same results, and a
+    # seen signature never lets a malformed call through
+    for _ in range(3):
+        assert AABB2Tuple(1, 2.0, 3, 4.0) == (1, 2, 3, 4)
+        assert AABB2Tuple((5, 6.0, 7, 8.0)) == (5, 6, 7, 8)
+        assert AABB2Tuple(np.int32(1), 2, np.float64(3), 4) == (1, 2, 3, 4)
+        assert AABB3Tuple(1, 2.0, 3, 4.0, 5, 6.0) == (1, 2, 3, 4, 5, 6)
+
+        with pytest.raises(TypeError):
+            AABB2Tuple(1, 2.0, 3, (4.0,))
+        with pytest.raises(TypeError):
+            AABB2Tuple((1, 2.0, 3, 4.0, 5))
+        with pytest.raises(TypeError):
+            AABB3Tuple(1, 2.0, 3, 4.0, 5, (6.0,))
+
+
+def test_aabb2_tuple_properties():
+    aabb_tuple = AABB2Tuple(1, 2, 3, 4)
+    assert aabb_tuple == (1, 2, 3, 4)
+    assert aabb_tuple.pos == (1, 2)
+    assert aabb_tuple.size == (3, 4)
+    assert AABB2Tuple(aabb_tuple) == aabb_tuple
+
+
+class TestAABB2Array(unittest.TestCase):
+    def test_append(self):
+        array: AABB2Array = AABB2Array()
+        self.assertEqual(len(array), 0)
+
+        for i in range(20):
+            array.append((i, i + 1, 2, 3))
+        array.append(AABB2((1, 2), (3, 4)))
+        self.assertEqual(len(array), 21)
+        self.assertEqual(array.x.tolist(), list(range(20)) + [1])
+        self.assertEqual(array.height.tolist(), [3] * 20 + [4])
+
+        aabb: AABB2 = array[-1]
+        self.assertIsInstance(aabb, AABB2)
+        self.assertEqual(AABB2Tuple(aabb), (1, 2, 3, 4))
+        self.assertEqual(len(list(array)), 21)
+        self.assertRaises(IndexError, lambda: array[21])
+
+    def test_intersects(self):
+        rng = np.random.default_rng(57)
+        boxes = rng.integers(-8, 8, size=(256, 4)).tolist()
+
+        array: AABB2Array = AABB2Array(len(boxes))
+        for box in boxes:
+            array.append(box)
+
+        other: AABB2 = AABB2((1, 1), (4, 4))
+        result = array.intersects(other)
+        self.assertEqual(result.shape, (256,))
+        self.assertEqual(result.tolist(), [AABB2(b).intersects(other) for b in boxes])
+
 
 # noinspection PyTypeChecker
 class TestAABB3(unittest.TestCase):
     # noinspection PyArgumentList
     def test_to_tuple(self):
-        (x, y, z), (w, h, d) = AABB3Tuple()
+        x, y, z, w, h, d = AABB3Tuple()
         self.assertEqual(x, 0)
         self.assertEqual(y, 0)
         self.assertEqual(z, 0)
@@ -204,7 +312,7 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 1)
         self.assertEqual(d, 1)
 
-        (x, y, z), (w, h, d) = AABB3Tuple(AABB3(1, 2, 3, 4, 5, 6))
+        x, y, z, w, h, d = AABB3Tuple(AABB3(1, 2, 3, 4, 5, 6))
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -212,7 +320,7 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 5)
         self.assertEqual(d, 6)
 
-        (x, y, z), (w, h, d) = AABB3Tuple(tuple())
+        x, y, z, w, h, d = AABB3Tuple(tuple())
         self.assertEqual(x, 0)
         self.assertEqual(y, 0)
         self.assertEqual(z, 0)
@@ -220,13 +328,7 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 1)
         self.assertEqual(d, 1)
 
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1,)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3, 4)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3, 4, 5)))
-
-        (x, y, z), (w, h, d) = AABB3Tuple((1, 2, 3, 4, 5, 6))
+        x, y, z, w, h, d = AABB3Tuple((1, 2, 3, 4, 5, 6))
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -234,12 +336,7 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 5)
         self.assertEqual(d, 6)
 
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3, 4, 5, 6, 7)))
-
-        self.assertRaises(TypeError, lambda: AABB3Tuple(((1, 2, 3), (4, 5))))
-        self.assertRaises(TypeError, lambda: AABB3Tuple(((1, 2), (3, 4, 5))))
-
-        (x, y, z), (w, h, d) = AABB3Tuple(((1, 2, 3), (4, 5, 6)))
+        x, y, z, w, h, d = AABB3Tuple(_NP_123456)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -247,15 +344,7 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 5)
         self.assertEqual(d, 6)
 
-        self.assertRaises(TypeError, lambda: AABB3Tuple(((1, 2, 3, 4), (5, 6, 7))))
-        self.assertRaises(TypeError, lambda: AABB3Tuple(((1, 2, 3), (4, 5, 6, 7))))
-
-        self.assertRaises(TypeError, lambda: AABB3Tuple(1, 2))
-        self.assertRaises(TypeError, lambda: AABB3Tuple(1, 2, 3))
-        self.assertRaises(TypeError, lambda: AABB3Tuple(1, 2, 3, 4))
-        self.assertRaises(TypeError, lambda: AABB3Tuple(1, 2, 3, 4, 5))
-
-        (x, y, z), (w, h, d) = AABB3Tuple((1, 2, 3), (4, 5, 6))
+        x, y, z, w, h, d = AABB3Tuple(((1, 2, 3), (4, 5, 6)))
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -263,12 +352,15 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 5)
         self.assertEqual(d, 6)
 
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3), (4, 5)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2), (3, 4, 5)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3, 4), (5, 6, 7)))
-        self.assertRaises(TypeError, lambda: AABB3Tuple((1, 2, 3), (4, 5, 6, 7)))
+        x, y, z, w, h, d = AABB3Tuple((1, 2, 3), (4, 5, 6))
+        self.assertEqual(x, 1)
+        self.assertEqual(y, 2)
+        self.assertEqual(z, 3)
+        self.assertEqual(w, 4)
+        self.assertEqual(h, 5)
+        self.assertEqual(d, 6)
 
-        (x, y, z), (w, h, d) = AABB3Tuple(1, 2, 3, 4, 5, 6)
+        x, y, z, w, h, d = AABB3Tuple(1, 2, 3, 4, 5, 6)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -276,7 +368,41 @@ class TestAABB3(unittest.TestCase):
         self.assertEqual(h, 5)
         self.assertEqual(d, 6)
 
-        self.assertRaises(TypeError, lambda: AABB3Tuple(1, 2, 3, 4, 5, 6, 7))
+        aabb_tuple = AABB3Tuple(1, 2, 3, 4, 5, 6)
+        self.assertEqual(aabb_tuple, (1, 2, 3, 4, 5, 6))
+        self.assertEqual(aabb_tuple.pos, (1, 2, 3))
+        self.assertEqual(aabb_tuple.size, (4, 5, 6))
+        self.assertEqual(AABB3Tuple(aabb_tuple), aabb_tuple)
+
+
+# noinspection PyArgumentList
+@pytest.mark.parametrize(
+    "args",
+    [
+        ((1,),),
+        ((1, 2),),
+        ((1, 2, 3),),
+        ((1, 2, 3, 4),),
+        ((1, 2, 3, 4, 5),),
+        ((1, 2, 3, 4, 5, 6, 7),),
+        (((1, 2, 3), (4, 5)),),
+        (((1, 2), (3, 4, 5)),),
+        (((1, 2, 3, 4), (5, 6, 7)),),
+        (((1, 2, 3), (4, 5, 6, 7)),),
+        (1, 2),
+        (1, 2, 3),
+        (1, 2, 3, 4),
+        (1, 2, 3, 4, 5),
+        ((1, 2, 3), (4, 5)),
+        ((1, 2), (3, 4, 5)),
+        ((1, 2, 3, 4), (5, 6, 7)),
+        ((1, 2, 3), (4, 5, 6, 7)),
+        (1, 2, 3, 4, 5, 6, 7),
+    ],
+)
+def test_aabb3_to_tuple_invalid(args):
+    with pytest.raises(TypeError):
+        AABB3Tuple(*args)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,32 @@
+import operator
 import unittest
 
 import numpy as np
+import pytest
 
+from helpers import v_eq
+from PyxelEngine.math import ValueVector2
 from PyxelEngine.math import Vector2
+from PyxelEngine.math import Vector2Array
 from PyxelEngine.math import Vector2c
 from PyxelEngine.math import Vector2Tuple
 from PyxelEngine.math import Vector3
+from PyxelEngine.math import Vector3Array
 from PyxelEngine.math import Vector3Tuple
 from PyxelEngine.math import Vector4
+from PyxelEngine.math import Vector4Array
 from PyxelEngine.math import Vector4Tuple
 
+# Shared read-only inputs so the tests do not rebuild them on every call
+_NP_12 = np.array([1, 2])
+_NP_12.setflags(write=False)
+_NP_34 = np.array([3, 4])
+_NP_34.setflags(write=False)
+_NP_123 = np.array([1, 2, 3])
+_NP_123.setflags(write=False)
+_NP_1234 = np.array([1, 2, 3, 4])
+_NP_1234.setflags(write=False)
+
 
 class TestVector2(unittest.TestCase):
     def test_to_tuple(self):
@@ -37,20 +54,26 @@ class TestVector2(unittest.TestCase):
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
 
-        x, y = Vector2Tuple(np.array([1, 2]))
+        x, y = Vector2Tuple(_NP_12)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
 
-        self.assertRaises(TypeError, lambda: Vector2Tuple((1, 2, 3)))
+        self.assertTrue(Vector2Tuple(1) is Vector2Tuple(1))
+        self.assertEqual(type(Vector2Tuple(1.0)[0]), float)
+        self.assertEqual(Vector2Tuple(100), (100, 100))
+
+        self.assertRaises(TypeError, Vector2Tuple, (1, 2, 3))
+        self.assertRaises(TypeError, Vector2Tuple, [1, 2, 3])
+        self.assertRaises(TypeError, Vector2Tuple, _NP_123)
 
         x, y = Vector2Tuple(1, 2)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
 
-        self.assertRaises(TypeError, lambda: Vector2Tuple((1, 2), 3))
-        self.assertRaises(TypeError, lambda: Vector2Tuple(1, (2, 3)))
+        self.assertRaises(TypeError, Vector2Tuple, (1, 2), 3)
+        self.assertRaises(TypeError, Vector2Tuple, 1, (2, 3))
 
-        self.assertRaises(TypeError, lambda: Vector2Tuple(1, 2, 3))
+        self.assertRaises(TypeError, Vector2Tuple, 1, 2, 3)
 
     def test_init(self):
         v: Vector2 = Vector2()
@@ -97,6 +120,18 @@ class TestVector2(unittest.TestCase):
         self.assertIsInstance(v, Vector2c)
         self.assertEqual(v.dtype, np.uint8)
 
+        v: Vector2 = Vector2(1.5, 2.5, dtype=np.float32)
+        self.assertIsInstance(v, Vector2)
+        self.assertEqual(v.dtype, np.float32)
+        self.assertEqual(v.astype(float).astype(np.float32).dtype, np.float32)
+        self.assertEqual((v + 1).dtype, np.float32)
+        self.assertEqual((v + Vector2(v, dtype=np.float32)).dtype, np.float32)
+
+        v_mixed = v + Vector2(1, 2, dtype=np.float64)
+        self.assertIsInstance(v_mixed, Vector2)
+        self.assertEqual(v_mixed.dtype, np.float64)
+        self.assertEqual(v_mixed, (2.5, 4.5))
+
     def test_conversions(self):
         v: Vector2 = Vector2(1, 2, dtype=int)
         v = v.astype(float, copy=True)
@@ -116,6 +151,14 @@ class TestVector2(unittest.TestCase):
         self.assertEqual(v.x, 7)
         self.assertEqual(v.y, 2)
 
+        v: Vector2 = Vector2(1.5, 2.5, dtype=float)
+        self.assertIs(v.astype(float, copy=False), v)
+        v_copy = v.astype(float)
+        self.assertIsNot(v_copy, v)
+        self.assertIsInstance(v_copy, Vector2)
+        v_copy.x += 1
+        self.assertEqual(v.x, 1.5)
+
     def test_instance(self):
         v: Vector2 = Vector2(1, 2, dtype=int)
         v_add: Vector2 = v + 1
@@ -127,9 +170,24 @@ class TestVector2(unittest.TestCase):
 
         v_perp = v.perpendicular()
         self.assertTrue(v is not v_perp)
+        self.assertEqual(v_perp.tolist(), [3, -2])
+        self.assertEqual(v_perp.dtype, v.dtype)
+
+        v_u8: Vector2 = Vector2(1, 2, dtype=np.uint8)
+        v_perp = v_u8.perpendicular()
+        self.assertEqual(v_perp.tolist(), [2, 255])
+        self.assertEqual(v_perp.dtype, np.uint8)
+        self.assertEqual(v_u8.tolist(), [1, 2])
+
+        v_perp_self = v_u8.perpendicular_self()
+        self.assertTrue(v_u8 is v_perp_self)
+        self.assertEqual(v_u8.tolist(), [2, 255])
 
+        data = v.__array_interface__["data"][0]
         v_perp_self = v.perpendicular_self()
         self.assertTrue(v is v_perp_self)
+        self.assertEqual(v.tolist(), [3, -2])
+        self.assertEqual(v.__array_interface__["data"][0], data)
 
     def test_equals(self):
         v: Vector2 = Vector2(1, 1, dtype=int)
@@ -142,97 +200,182 @@ class TestVector2(unittest.TestCase):
         self.assertTrue(v != Vector2(1, 2, dtype=int))
         self.assertTrue(v != Vector2(1, 2, dtype=float))
 
-    def test_add(self):
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v += 1
-        self.assertTrue(v == (2, 3))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v += (1, 2)
-        self.assertTrue(v == (2, 4))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v += Vector2(1, 2, dtype=int)
-        self.assertTrue(v == (2, 4))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v += Vector2(1.5, 2.5, dtype=float).astype(int)
-        self.assertTrue(v == (2, 4))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v += 1
-        self.assertTrue(v == (2.0, 3.0))
-        self.assertEqual(v.dtype, float)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v += 1.5
-        self.assertTrue(v == (2.5, 3.5))
-        self.assertEqual(v.dtype, float)
-
+    def test_scalar_fast_paths(self):
         v: Vector2 = Vector2(1, 2, dtype=float)
-        v += (1, 2)
-        self.assertTrue(v == (2, 4))
-        self.assertEqual(v.dtype, float)
+        self.assertEqual((v + 1).tolist(), [2.0, 3.0])
+        self.assertEqual((v + (0.5, 1.5)).tolist(), [1.5, 3.5])
+        self.assertEqual((v - 1).tolist(), [0.0, 1.0])
+        self.assertEqual((v - (0.5, 1.5)).tolist(), [0.5, 0.5])
+        self.assertEqual((v * 2).tolist(), [2.0, 4.0])
+        self.assertEqual((v * (0.5, 1.5)).tolist(), [0.5, 3.0])
+        self.assertIsInstance(v + 1, Vector2)
+        self.assertEqual(v.perpendicular_self().tolist(), [2.0, -1.0])
 
         v: Vector2 = Vector2(1, 2, dtype=float)
-        v += Vector2(1, 2, dtype=float)
-        self.assertTrue(v == (2, 4))
+        v += Vector2(1.5, 2.5, dtype=np.float32)
+        self.assertEqual(v.tolist(), [2.5, 4.5])
+        self.assertEqual((v - Vector2(True, False, dtype=bool)).tolist(), [1.5, 4.5])
         self.assertEqual(v.dtype, float)
 
+        # Pairs that are not two real scalars keep numpy's promotion/broadcast
         v: Vector2 = Vector2(1, 2, dtype=float)
-        v += Vector2(1, 2, dtype=int)
-        self.assertTrue(v == (2, 4))
-        self.assertEqual(v.dtype, float)
+        self.assertEqual((v + (1j, 0)).tolist(), [1 + 1j, 2 + 0j])
+        self.assertEqual((v + ((1, 2), (3, 4))).tolist(), [[2.0, 4.0], [4.0, 6.0]])
 
-    def test_sub(self):
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v -= 1
-        self.assertTrue(v == (0, 1))
-        self.assertEqual(v.dtype, int)
+        v: Vector2 = Vector2(1, 2, dtype=np.float32)
+        v += 1
+        self.assertEqual(v.dtype, np.float32)
 
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v -= (1, 2)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, int)
+        # Equal to float64 but not the interned dtype, so numpy handles it
+        v: Vector2 = Vector2(1, 2).astype(">f8")
+        self.assertEqual((v + 1).tolist(), [2.0, 3.0])
+        self.assertEqual((v + 1).dtype, float)
 
         v: Vector2 = Vector2(1, 2, dtype=int)
-        v -= Vector2(1, 2, dtype=int)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=int)
-        v -= Vector2(1.5, 2.5, dtype=float).astype(int)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, int)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v -= 1
-        self.assertTrue(v == (0.0, 1.0))
-        self.assertEqual(v.dtype, float)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v -= 0.5
-        self.assertTrue(v == (0.5, 1.5))
-        self.assertEqual(v.dtype, float)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v -= (1, 2)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, float)
-
-        v: Vector2 = Vector2(1, 2, dtype=float)
-        v -= Vector2(1, 2, dtype=float)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, float)
+        self.assertRaises(TypeError, v.__iadd__, 1.5)
+        self.assertRaises(TypeError, v.__isub__, 1.5)
+        self.assertRaises(TypeError, v.__imul__, 1.5)
 
+        v: Vector2 = Vector2(1, 2, dtype=np.int64)
+        v += 1
+        v *= (2, 3)
+        v -= Vector2(1, 1, dtype=np.int64)
+        self.assertEqual(v.tolist(), [3, 8])
+        self.assertEqual(v.dtype, np.int64)
+        self.assertEqual((v + 1).dtype, np.int64)
+        self.assertEqual((v * (1, 2)).dtype, np.int64)
+        self.assertEqual((v + (1, 0.5)).tolist(), [4.0, 8.5])
+        self.assertEqual((v + Vector2(1, 2, dtype=np.int32)).dtype, np.int64)
+
+        # int64 results that leave its range wrap around like numpy
+        big: Vector2 = Vector2(2**62, 3, dtype=np.int64)
+        wrapped = [-(2**63), 6]
+        self.assertEqual((big + big).tolist(), wrapped)
+        self.assertEqual((big * 2).tolist(), wrapped)
+        self.assertEqual((big - (-(2**62), -3)).tolist(), wrapped)
+        v: Vector2 = big.copy()
+        v *= (2, 2)
+        self.assertEqual(v.tolist(), wrapped)
+        v: Vector2 = Vector2(3, 2**62, dtype=np.int64)
+        v += (3, 2**62)
+        self.assertEqual(v.tolist(), [6, -(2**63)])
+
+    def test_magnitude(self):
+        v: Vector2 = Vector2(3, 4, dtype=float)
+        self.assertEqual(v.magnitude, 5.0)
+        self.assertEqual(v.magnitude_sq, 25.0)
+        self.assertEqual(v.dot((1, 2)), 11.0)
+        self.assertEqual(v.dot(Vector2(1, 2)), 11.0)
+        self.assertEqual(v.dot([1, 2]), 11.0)
+        # Scalars keep np.dot's behaviour and scale the vector
+        self.assertEqual(v.dot(2).tolist(), [6.0, 8.0])
+        self.assertEqual(Vector3(1, 2, 3).dot(2).tolist(), [2.0, 4.0, 6.0])
+        self.assertEqual(Vector4(1, 2, 3, 4).dot(Vector4(1, 1, 1, 1)), 10.0)
+
+        v_norm = v.normalize_self()
+        self.assertIs(v_norm, v)
+        self.assertAlmostEqual(v.x, 0.6)
+        self.assertAlmostEqual(v.y, 0.8)
+        self.assertAlmostEqual(v.magnitude, 1.0)
+
+        v.magnitude = 10
+        self.assertAlmostEqual(v.x, 6.0)
+        self.assertAlmostEqual(v.y, 8.0)
+
+    def test_distance(self):
         v: Vector2 = Vector2(1, 2, dtype=float)
-        v -= Vector2(1, 2, dtype=int)
-        self.assertTrue(v == (0, 0))
-        self.assertEqual(v.dtype, float)
+        self.assertEqual(v.distance_sq((4, 6)), 25.0)
+        self.assertEqual(v.distance(Vector2(4, 6)), 5.0)
+        self.assertEqual(v.distance(1), 1.0)
+        self.assertEqual(v.distance(np.array([4, 6])), 5.0)
+
+    def test_normalize_self_fallback(self):
+        # Same results as normalize() where the scalar path does not apply
+        with np.errstate(invalid="ignore"):
+            self.assertTrue(np.isnan(Vector2().normalize()).all())
+            self.assertTrue(np.isnan(Vector2().normalize_self()).all())
+            self.assertTrue(np.isnan(Vector3().normalize_self()).all())
+            self.assertTrue(np.isnan(Vector4(0, 0, 0, 0).normalize_self()).all())
+        self.assertRaises(TypeError, Vector2(3, 4, dtype=int).normalize_self)
+        self.assertRaises(TypeError, Vector3(3, 4, 0, dtype=int).normalize_self)
+        self.assertRaises(TypeError, Vector4(3, 4, 0, 0, dtype=int).normalize_self)
+
+    def test_magnitude_setter_int(self):
+        for v in (Vector2(3, 4, dtype=int), Vector3(3, 4, 0, dtype=int)):
+            with self.assertRaises(TypeError):
+                v.magnitude = 10
+            self.assertEqual(v.tolist()[:2], [3, 4])
+
+    def test_magnitude_setter_zero(self):
+        # Same result as normalize() on a zero vector instead of raising
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for v in (Vector2(), Vector3(), Vector4(0, 0, 0, 0)):
+                v.magnitude = 5
+                self.assertTrue(np.isnan(v).all())
+
+
+# Built once per dtype; each test mutates its own copy
+_V12 = {int: Vector2(1, 2, dtype=int), float: Vector2(1, 2, dtype=float)}
+
+
+@pytest.fixture
+def v12(dtype) -> Vector2:
+    return _V12[dtype].copy()
+
+
+_INPLACE_OPS = {"add": operator.iadd, "sub": operator.isub, "mul": operator.imul}
+
+# (op, dtype, rhs, expected) for in-place arithmetic on a (1, 2) vector
+_INPLACE_CASES = [
+    ("add", int, 1, (2, 3)),
+    ("add", int, (1, 2), (2, 4)),
+    ("add", int, Vector2(1, 2, dtype=int), (2, 4)),
+    ("add", int, Vector2(1.5, 2.5, dtype=float).astype(int), (2, 4)),
+    ("add", float, 1, (2.0, 3.0)),
+    ("add", float, 1.5, (2.5, 3.5)),
+    ("add", float, (1, 2), (2, 4)),
+    ("add", float, Vector2(1, 2, dtype=float), (2, 4)),
+    ("add", float, Vector2(1, 2, dtype=int), (2, 4)),
+    ("sub", int, 1, (0, 1)),
+    ("sub", int, (1, 2), (0, 0)),
+    ("sub", int, Vector2(1, 2, dtype=int), (0, 0)),
+    ("sub", int, Vector2(1.5, 2.5, dtype=float).astype(int), (0, 0)),
+    ("sub", float, 1, (0.0, 1.0)),
+    ("sub", float, 0.5, (0.5, 1.5)),
+    ("sub", float, (1, 2), (0, 0)),
+    ("sub", float, Vector2(1, 2, dtype=float), (0, 0)),
+    ("sub", float, Vector2(1, 2, dtype=int), (0, 0)),
+    ("mul", int, 2, (2, 4)),
+    ("mul", int, (3, 2), (3, 4)),
+    ("mul", float, 1.5, (1.5, 3.0)),
+    ("mul", float, (2, 0.5), (2.0, 1.0)),
+    ("mul", float, Vector2(2, 3, dtype=float), (2.0, 6.0)),
+]
+
+
+# In-place arithmetic is checked with plain asserts so the TestCase assert
+# machinery does not dominate the cost of the Vector2 op being tested.
+@pytest.mark.parametrize("op,dtype,rhs,expected", _INPLACE_CASES)
+def test_vector2_inplace(v12, op, dtype, rhs, expected):
+    v: Vector2 = _INPLACE_OPS[op](v12, rhs)
+    assert v is v12
+    v_eq(v, expected)
+    assert v.dtype == dtype
+
+
+# The vector_tests.py walkthrough as an assertion-based test
+def test_repr_smoke():
+    vector_i: Vector3 = Vector3(1, 2, 7, dtype=int)
+    assert repr(vector_i) == "Vector3([1, 2, 7])"
+
+    vector_f: Vector3 = Vector3(1.5, 2.5, 7, dtype=float)
+    vector_f[:] = 1, 5, 23
+
+    result = (vector_i + vector_f + 1).astype(int, copy=False)
+    assert isinstance(result, Vector3)
+    assert result.dtype == int
+    assert result == (3, 8, 31)
+    assert repr(result) == "Vector3([ 3,  8, 31])"
 
 
 class TestVector3(unittest.TestCase):
@@ -257,7 +400,7 @@ class TestVector3(unittest.TestCase):
         self.assertEqual(y, 1)
         self.assertEqual(z, 1)
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple((1, 2)))
+        self.assertRaises(TypeError, Vector3Tuple, (1, 2))
 
         x, y, z = Vector3Tuple((1, 2, 3))
         self.assertEqual(x, 1)
@@ -269,14 +412,14 @@ class TestVector3(unittest.TestCase):
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
 
-        x, y, z = Vector3Tuple(np.array([1, 2, 3]))
+        x, y, z = Vector3Tuple(_NP_123)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple((1, 2, 3, 4)))
+        self.assertRaises(TypeError, Vector3Tuple, (1, 2, 3, 4))
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, 2))
+        self.assertRaises(TypeError, Vector3Tuple, 1, 2)
 
         x, y, z = Vector3Tuple((1, 2), 3)
         self.assertEqual(x, 1)
@@ -288,26 +431,51 @@ class TestVector3(unittest.TestCase):
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
 
-        x, y, z = Vector3Tuple(np.array([1, 2]), 3)
+        x, y, z = Vector3Tuple(_NP_12, 3)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, (2, 3)))
-        self.assertRaises(TypeError, lambda: Vector3Tuple((1, 2, 3), 4))
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, (2, 3, 4)))
-        self.assertRaises(TypeError, lambda: Vector3Tuple((1, 2), (3, 4)))
+        self.assertRaises(TypeError, Vector3Tuple, 1, (2, 3))
+        self.assertRaises(TypeError, Vector3Tuple, (1, 2, 3), 4)
+        self.assertRaises(TypeError, Vector3Tuple, 1, (2, 3, 4))
+        self.assertRaises(TypeError, Vector3Tuple, (1, 2), (3, 4))
 
         x, y, z = Vector3Tuple(1, 2, 3)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple((1, 2), 3, 4))
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, (2, 3), 4))
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, 2, (3, 4)))
+        self.assertRaises(TypeError, Vector3Tuple, (1, 2), 3, 4)
+        self.assertRaises(TypeError, Vector3Tuple, 1, (2, 3), 4)
+        self.assertRaises(TypeError, Vector3Tuple, 1, 2, (3, 4))
+
+        self.assertRaises(TypeError, Vector3Tuple, 1, 2, 3, 4)
 
-        self.assertRaises(TypeError, lambda: Vector3Tuple(1, 2, 3, 4))
+    def test_equals(self):
+        v: Vector3 = Vector3(1, 1, 1, dtype=int)
+        self.assertTrue(v == 1)
+        self.assertTrue(v == (1, 1, 1))
+        self.assertTrue(v == Vector3(1, 1, 1, dtype=int))
+        self.assertTrue(v == Vector3(1, 1, 1, dtype=float))
+        self.assertTrue(v != 1.1)
+        self.assertTrue(v != (1, 2, 1))
+        self.assertTrue(v != Vector3(1, 2, 1, dtype=int))
+        self.assertTrue(v != Vector3(1, 2, 1, dtype=float))
+
+    def test_angle_between(self):
+        v: Vector3 = Vector3(1, 0, 0, dtype=float)
+        self.assertAlmostEqual(v.angle_between(0, 1, 0), np.pi / 2)
+        self.assertAlmostEqual(v.angle_between((-2, 0, 0)), np.pi)
+        self.assertEqual(v.angle_between(Vector3(3, 0, 0)), 0.0)
+        self.assertEqual(v.angle_between(0, 0, 0), 0.0)
+        self.assertEqual(Vector3().angle_between(v), 0.0)
+
+    def test_distance(self):
+        v: Vector3 = Vector3(1, 2, 3, dtype=float)
+        self.assertEqual(v.distance_sq((2, 4, 5)), 9.0)
+        self.assertEqual(v.distance(Vector3(2, 4, 5)), 3.0)
+        self.assertEqual(v.distance(1), np.linalg.norm(v - 1))
 
 
 class TestVector4(unittest.TestCase):
@@ -336,7 +504,7 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 1)
         self.assertEqual(w, 1)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2)))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2))
 
         x, y, z, w = Vector4Tuple((1, 2, 3))
         self.assertEqual(x, 1)
@@ -350,7 +518,7 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 1)
 
-        x, y, z, w = Vector4Tuple(np.array([1, 2, 3]))
+        x, y, z, w = Vector4Tuple(_NP_123)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
@@ -368,14 +536,14 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        x, y, z, w = Vector4Tuple(np.array([1, 2, 3, 4]))
+        x, y, z, w = Vector4Tuple(_NP_1234)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2, 3, 4, 5)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2, 3, 4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2)
 
         x, y, z, w = Vector4Tuple((1, 2, 3), 4)
         self.assertEqual(x, 1)
@@ -389,17 +557,17 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        x, y, z, w = Vector4Tuple(np.array([1, 2, 3]), 4)
+        x, y, z, w = Vector4Tuple(_NP_123, 4)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), 3))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2, 3, 4), 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3, 4)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3, 4, 5)))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), 3)
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2, 3, 4), 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3))
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3, 4))
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3, 4, 5))
 
         x, y, z, w = Vector4Tuple((1, 2), (3, 4))
         self.assertEqual(x, 1)
@@ -413,14 +581,14 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        x, y, z, w = Vector4Tuple(np.array([1, 2]), np.array([3, 4]))
+        x, y, z, w = Vector4Tuple(_NP_12, _NP_34)
         self.assertEqual(x, 1)
         self.assertEqual(y, 2)
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2, 3), (4, 5)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), (3, 4, 5)))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2, 3), (4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), (3, 4, 5))
 
         x, y, z, w = Vector4Tuple(1, 2, 3)
         self.assertEqual(x, 1)
@@ -428,19 +596,19 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 1)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), 3, 4))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3), 4))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2, (3, 4)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), (3, 4), 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), 3, (4, 5)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3), (4, 5)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2, 3), 4, 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3, 4), 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2, (3, 4, 5)))
-        self.assertRaises(TypeError, lambda: Vector4Tuple((1, 2), 3, 4, 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, (2, 3), 4, 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2, (3, 4), 5))
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2, 3, (4, 5)))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), 3, 4)
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3), 4)
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2, (3, 4))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), (3, 4), 5)
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), 3, (4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3), (4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2, 3), 4, 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3, 4), 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2, (3, 4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, (1, 2), 3, 4, 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, (2, 3), 4, 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2, (3, 4), 5)
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2, 3, (4, 5))
 
         x, y, z, w = Vector4Tuple(1, 2, 3, 4)
         self.assertEqual(x, 1)
@@ -448,7 +616,132 @@ class TestVector4(unittest.TestCase):
         self.assertEqual(z, 3)
         self.assertEqual(w, 4)
 
-        self.assertRaises(TypeError, lambda: Vector4Tuple(1, 2, 3, 4, 5))
+        self.assertRaises(TypeError, Vector4Tuple, 1, 2, 3, 4, 5)
+
+    def test_equals(self):
+        v: Vector4 = Vector4(1, 1, 1, 1, dtype=int)
+        self.assertTrue(v == 1)
+        self.assertTrue(v == (1, 1, 1, 1))
+        self.assertTrue(v == Vector4(1, 1, 1, 1, dtype=int))
+        self.assertTrue(v == Vector4(1, 1, 1, 1, dtype=float))
+        self.assertTrue(v != 1.1)
+        self.assertTrue(v != (1, 1, 2, 1))
+        self.assertTrue(v != Vector4(1, 1, 2, 1, dtype=int))
+        self.assertTrue(v != Vector4(1, 1, 2, 1, dtype=float))
+
+    def test_angle_between(self):
+        v: Vector4 = Vector4(1, 0, 0, 0, dtype=float)
+        self.assertAlmostEqual(v.angle_between(0, 0, 0, 1), np.pi / 2)
+        self.assertEqual(v.angle_between(Vector4(1, 0, 0, 0)), 0.0)
+        self.assertEqual(v.angle_between(0, 0, 0, 0), 0.0)
+        self.assertEqual(Vector4(0, 0, 0, 0).angle_between(v), 0.0)
+
+    def test_distance(self):
+        v: Vector4 = Vector4(1, 2, 3, 4, dtype=float)
+        self.assertEqual(v.distance_sq((2, 3, 4, 5)), 4.0)
+        self.assertEqual(v.distance(Vector4(2, 3, 4, 5)), 2.0)
+        self.assertEqual(v.distance(1), np.linalg.norm(v - 1))
+
+
+class TestVectorArray(unittest.TestCase):
+    def test_append(self):
+        array: Vector2Array = Vector2Array()
+        for i in range(10):
+            array.append((i, 2 * i))
+        array.append(Vector2(1.5, 2.5))
+        self.assertEqual(len(array), 11)
+        self.assertEqual(array.x.tolist(), list(range(10)) + [1.5])
+        self.assertEqual(array.y.tolist(), list(range(0, 20, 2)) + [2.5])
+
+        v: Vector2 = array[-1]
+        self.assertIsInstance(v, Vector2)
+        self.assertTrue(v == (1.5, 2.5))
+        self.assertEqual(len(list(array)), 11)
+        self.assertRaises(IndexError, lambda: array[11])
+
+        array: Vector4Array = Vector4Array(dtype=int)
+        array.append(Vector3(1, 2, 3, dtype=int))
+        self.assertEqual(array.dtype, np.int_)
+        self.assertEqual(array[0], (1, 2, 3, 1))
+
+    def test_batch_math(self):
+        a: Vector3Array = Vector3Array(4)
+        b: Vector3Array = Vector3Array(4)
+        for i in range(4):
+            a.append((i, i, i))
+            b.append((1, 2, 3))
+
+        np.add(a.x, b.x, out=a.x)
+        dot = a.x * b.x + a.y * b.y + a.z * b.z
+        self.assertEqual(a.x.tolist(), [1, 2, 3, 4])
+        self.assertEqual(dot.tolist(), [a[i].dot(b[i]) for i in range(4)])
+        self.assertEqual(a.dot(b).tolist(), dot.tolist())
+
+        cross: Vector3Array = a.cross(b)
+        self.assertEqual(len(cross), 4)
+        for i in range(4):
+            self.assertTrue(cross[i] == a[i].cross(b[i]))
+        self.assertRaises(ValueError, a.dot, Vector3Array())
+
+
+class TestValueVector2(unittest.TestCase):
+    def test_init(self):
+        v: ValueVector2 = ValueVector2(1, 2, dtype=int)
+        self.assertIsInstance(v, Vector2c)
+        self.assertEqual((v.x, v.y), (1, 2))
+        self.assertEqual(v.dtype, int)
+        self.assertEqual(ValueVector2().tolist(), [0.0, 0.0])
+        self.assertEqual(ValueVector2(3).tolist(), [3.0, 3.0])
+        self.assertEqual(ValueVector2((1, 2)).tolist(), [1.0, 2.0])
+        self.assertEqual(ValueVector2(Vector2(1, 2)).tolist(), [1.0, 2.0])
+        self.assertRaises(TypeError, ValueVector2, 1, (2, 3))
+        self.assertRaises(TypeError, ValueVector2, 1, 2, 3)
+        self.assertRaises(TypeError, ValueVector2, "1", "2")
+        self.assertRaises(TypeError, ValueVector2, b"1", 2)
+
+    def test_math(self):
+        v: ValueVector2 = ValueVector2(1, 2, dtype=int)
+        self.assertEqual((v + 1).tolist(), [2, 3])
+        self.assertEqual((v + 1.5).dtype, float)
+        self.assertEqual((v - (1, 1)).tolist(), [0, 1])
+        self.assertEqual(((3, 3) - v).tolist(), [2, 1])
+        self.assertEqual((2 * v).tolist(), [2, 4])
+        self.assertEqual((v / 2).tolist(), [0.5, 1.0])
+        self.assertEqual((v + Vector2(1, 1)).tolist(), [2.0, 3.0])
+        self.assertTrue(v == (1, 2))
+        self.assertTrue(v == Vector2(1, 2))
+        self.assertFalse(v == (1, 2, 3))
+        self.assertEqual(v.dot((3, 4)), 11)
+        self.assertEqual(ValueVector2(3, 4).magnitude, 5.0)
+
+        v_iadd = v
+        v_iadd += 1
+        self.assertTrue(v is v_iadd)
+        self.assertEqual(v.tolist(), [2, 3])
+        self.assertEqual(v.perpendicular().tolist(), [3, -2])
+        self.assertTrue(v.perpendicular_self() is v)
+        self.assertEqual(v.tolist(), [3, -2])
+
+        # Same as Vector2: int vectors do not truncate in-place float math
+        self.assertRaises(TypeError, v.__iadd__, 1.5)
+        self.assertRaises(TypeError, v.__isub__, (1, 0.5))
+        self.assertRaises(TypeError, v.__imul__, ValueVector2(1.5, 2))
+        self.assertEqual(v.tolist(), [3, -2])
+        v *= Vector2(2, 1, dtype=int)
+        self.assertEqual(v.tolist(), [6, -2])
+
+        v: ValueVector2 = ValueVector2(1, 2)
+        v += 1.5
+        self.assertEqual(v.tolist(), [2.5, 3.5])
+
+    def test_numpy(self):
+        v: ValueVector2 = ValueVector2(1.5, 2.5)
+        self.assertEqual(np.asarray(v).tolist(), [1.5, 2.5])
+        self.assertEqual((Vector2(1, 1) + v).tolist(), [2.5, 3.5])
+        self.assertEqual(v.astype(np.float32).dtype, np.float32)
+        self.assertIsNot(v.astype(float), v)
+        self.assertIs(v.astype(float, copy=False), v)
+        self.assertEqual(v.astype(int, copy=False).tolist(), [1, 2])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+import math
+import timeit
+
+from PyxelEngine.math import Vector2
+
+# Vector operations only do 2-16 flops per call, so they are bound by Python and
+# numpy dispatch rather than by compute or memory. Each row compares the
+# Vector2 call against the same math on plain tuples, which is the floor for a
+# pure Python rewrite.
+
+
+def _tuple_dot(a, b):
+    return a[0] * b[0] + a[1] * b[1]
+
+
+def _tuple_lerp(a, b, t):
+    return a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t
+
+
+def _tuple_smooth_step(a, b, t):
+    t2 = t * t
+    s = 3.0 * t2 - 2.0 * t2 * t
+    return a[0] + (b[0] - a[0]) * s, a[1] + (b[1] - a[1]) * s
+
+
+def _time(statement) -> float:
+    timer = timeit.Timer(statement)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    a: Vector2 = Vector2(1.5, 2.5)
+    b: Vector2 = Vector2(3.0, -1.0)
+    ta = tuple(a.tolist())
+    tb = tuple(b.tolist())
+
+    cases = {
+        "new": (
+            lambda: Vector2(1.5, 2.5),
+            lambda: Vector2._make(1.5, 2.5),
+            lambda: (1.5, 2.5),
+        ),
+        "add": (
+            lambda: a + b,
+            lambda: Vector2._make(a.x + b.x, a.y + b.y),
+            lambda: (ta[0] + tb[0], ta[1] + tb[1]),
+        ),
+        "eq_scalar": (
+            lambda: a == 1.5,
+            None,
+            lambda: ta[0] == 1.5 and ta[1] == 1.5,
+        ),
+        "eq_tuple": (
+            lambda: a == (1.5, 2.5),
+            None,
+            lambda: ta == (1.5, 2.5),
+        ),
+        "eq_vector": (
+            lambda: a == b,
+            None,
+            lambda: ta == tb,
+        ),
+        "dot": (
+            lambda: a.dot(b),
+            None,
+            lambda: _tuple_dot(ta, tb),
+        ),
+        "magnitude": (
+            lambda: a.magnitude,
+            None,
+            lambda: math.sqrt(_tuple_dot(ta, ta)),
+        ),
+        "perpendicular": (
+            lambda: a.perpendicular(),
+            None,
+            lambda: (ta[1], -ta[0]),
+        ),
+        "perp_self": (
+            lambda: a.perpendicular_self(),
+            None,
+            lambda: (ta[1], -ta[0]),
+        ),
+        "lerp": (
+            lambda: a.lerp(b, 0.25),
+            None,
+            lambda: _tuple_lerp(ta, tb, 0.25),
+        ),
+        "smooth_step": (
+            lambda: a.smooth_step(b, 0.25),
+            None,
+            lambda: _tuple_smooth_step(ta, tb, 0.25),
+        ),
+    }
+
+    print(f"{'op':<14}{'Vector2':>10}{'_make':>10}{'tuple':>10}  (us/call)")
+    for name, statements in cases.items():
+        columns = "".join(
+            f"{_time(statement):>10.3f}" if statement is not None else f"{'-':>10}"
+            for statement in statements
+        )
+        print(f"{name:<14}{columns}")
+
+
+if __name__ == "__main__":
+    main()
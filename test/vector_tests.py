@@ -9,7 +9,10 @@ def main():
     print(vector_f, repr(vector_f), vector_f.x, vector_f.y)
     vector_f[:] = 1, 5, 23
 
-    result = (vector_i + vector_f + 1).astype(int, copy=False)
+    # The float sum is the only temporary, the +1 is folded into it in place
+    result = vector_i + vector_f
+    result += 1
+    result = result.astype(int, copy=False)
     print(result, repr(result), result.x, result.y)
     print(result, repr(result), result.x, result.y, result == (3, 8, 31))
     print(result.astype(int))